@@ -1,13 +1,24 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import logging
 import os
 import sys
 import threading
 import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib json module is used without it
+    orjson = None
 
 import darkdetect
-import pyperclip
 from aiprovider import GeminiProvider, OpenAICompatibleProvider
+from clipboard_manager import ClipboardManager
 from pynput import keyboard as pykeyboard
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Signal, Slot
@@ -16,8 +27,90 @@ from PySide6.QtWidgets import QMessageBox
 from ui.AboutWindow import AboutWindow
 from ui.CustomPopupWindow import CustomPopupWindow
 from ui.OnboardingWindow import OnboardingWindow
+from ui.ResponseWindow import ChatMsg, ResponseWindow
 from ui.SettingsWindow import SettingsWindow
+from ui.UIUtils import _APP_DIR, _APP_ICON_PATH, UIUtils, is_dark_mode
 from update_checker import UpdateChecker
+from windows_hotkey import WindowsHotkey
+
+# (prompt prefix, system instruction) per writing option, built once at import
+_OPTION_PROMPTS = MappingProxyType({
+    'Proofread': (
+        'Proofread this:\n\n',
+        'You are a grammar proofreading assistant. Output ONLY the corrected text without any additional comments. Maintain the original text structure and writing style. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with this (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Rewrite': (
+        'Rewrite this:\n\n',
+        'You are a writing assistant. Rewrite the text provided by the user to improve phrasing. Output ONLY the rewritten text without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with proofreading (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Friendly': (
+        'Make this more friendly:\n\n',
+        'You are a writing assistant. Rewrite the text provided by the user to be more friendly. Output ONLY the friendly text without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with rewriting (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Professional': (
+        'Make this more professional:\n\n',
+        'You are a writing assistant. Rewrite the text provided by the user to sound more professional. Output ONLY the professional text without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with this (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Concise': (
+        'Make this more concise:\n\n',
+        'You are a writing assistant. Rewrite the text provided by the user to be slightly more concise in tone, thus making it just a bit shorter. Do not change the text too much or be too reductive. Output ONLY the concise version without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with this (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Summary': (
+        'Summarize this:\n\n',
+        'You are a summarisation assistant. Provide a succinct summary of the text provided by the user. The summary should be succinct yet encompass all the key insightful points. To make it quite legible and readable, you MUST use Markdown formatting (bold, italics, underline...). You should add line spacing between your paragraphs/lines. Only if appropriate, you could also use headings (only the very small ones), lists, tables, etc. Don\'t be repetitive or too verbose. Output ONLY the summary without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with summarisation (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Key Points': (
+        'Extract key points from this:\n\n',
+        'You are an assistant that extracts key points from text provided by the user. Output ONLY the key points without additional comments. You MUST use Markdown formatting (lists, bold, italics, underline, etc. as appropriate) to make it quite legible and readable. Don\'t be repetitive or too verbose. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with extracting key points (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Table': (
+        'Convert this into a table:\n\n',
+        'You are an assistant that converts text provided by the user into a Markdown table. Output ONLY the table without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is completely incompatible with this with conversion, output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    ),
+    'Custom': (
+        'Make the following change to this text:\n\n',
+        'You are a writing and coding assistant. You MUST make the user\'s described change to the text or code provided by the user. Output ONLY the appropriately modified text or code without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text or code is absolutely incompatible with the requested change, output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
+    )
+})
+
+@functools.lru_cache(maxsize=16)
+def parse_pynput_shortcut(shortcut):
+    """
+    Parse a shortcut string such as ctrl+alt+h into pynput keys, once per distinct shortcut.
+    """
+    # For example ctrl+alt+h -> <ctrl>+<alt>+h
+    shortcut = '+'.join([f'{t}' if len(t) <= 1 else f'<{t}>' for t in shortcut.split('+')])
+    return tuple(pykeyboard.HotKey.parse(shortcut))
+
+
+def dump_config(config):
+    """
+    Serialize the config to UTF-8 JSON bytes, with orjson when it is installed.
+    The fallback is formatted the same way (2-space indent, non-ASCII kept as is), so the file
+    doesn't change shape depending on which one saved it last.
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def parse_config(data):
+    """
+    Parse config JSON bytes, with orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Options whose result is shown in a response window instead of replacing the selection
+_WINDOW_OPTIONS = frozenset({'Summary', 'Key Points', 'Table'})
+
+# What the model answers when the text doesn't fit the option; it has no whitespace inside
+ERROR_TEXT_INCOMPATIBLE = 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'
+
+RESPONSE_CACHE_SIZE = 32  # Most recent AI responses kept for repeated requests on the same text
+RESPONSE_CACHE_FILE = 'response_cache.json'  # Where they are kept between runs (if persist_response_cache is on)
 
 
 class WritingToolApp(QtWidgets.QApplication):
@@ -28,26 +121,64 @@ class WritingToolApp(QtWidgets.QApplication):
     show_message_signal = Signal(str, str)  # a signal for showing message boxes
     hotkey_triggered_signal = Signal()
     followup_response_signal = Signal(str)
+    typed_output_signal = Signal(str)  # response chunks typed into the focused app as they stream in
+    typed_output_done_signal = Signal()
+    theme_changed = Signal(bool)  # is_dark; emitted from darkdetect's listener thread on Qt < 6.5
+    _tray_palettes = {}  # is_dark -> tray menu palette
 
 
     def __init__(self, argv):
         super().__init__(argv)
         logging.debug('Initializing WritingToolApp')
         self.output_ready_signal.connect(self.replace_text)
+        self.typed_output_signal.connect(self.type_text_chunk)
+        self.typed_output_done_signal.connect(self.finish_typed_output)
         self.show_message_signal.connect(self.show_message_box)
         self.hotkey_triggered_signal.connect(self.on_hotkey_pressed)
+        # Default icon for every window, set once instead of on each popup
+        if not UIUtils.app_icon().isNull():
+            self.setWindowIcon(UIUtils.app_icon())
+        # Qt 6.5+ reports OS theme switches itself; older versions get them from darkdetect's listener
+        self._system_dark = is_dark_mode()
+        if hasattr(self.styleHints(), 'colorSchemeChanged'):
+            self.styleHints().colorSchemeChanged.connect(self.on_color_scheme_changed)
+        else:
+            self.theme_changed.connect(self.on_system_theme_changed)
+            threading.Thread(target=self._listen_for_theme_changes, name='darkdetect', daemon=True).start()
         self.config = None
         self.config_path = None
+        self._saved_config_json = None  # What is on disk, so unchanged saves can be skipped
+        self._config_transaction_depth = 0
+        self._config_save_pending = False
         self.load_config()
         self.onboarding_window = None
         self.popup_window = None
         self.tray_icon = None
+        self.tray_menu = None
+        self.message_boxes = []  # open non-modal warnings
         self.settings_window = None
         self.about_window = None
         self.registered_hotkey = None
         self.output_queue = ""
+        self._typed_length = 0  # How much of output_queue has been typed, while streaming into the focused app
         self.last_replace = 0
         self.hotkey_listener = None
+        self.windows_hotkey = None
+        # Recent AI responses keyed by provider and request; filled from the processing threads
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._response_cache_dirty = False  # Whether the cache differs from what is on disk
+        # Nothing needs the saved responses during startup, so they are read off the GUI thread
+        threading.Thread(target=self.load_response_cache, name='response-cache', daemon=True).start()
+
+        # Copies the selection and pastes results without blocking the event loop
+        self.clipboard_manager = ClipboardManager(self)
+        self.clipboard_manager.selection_ready.connect(self._show_popup)
+
+        # One asyncio loop on its own thread runs every AI request, instead of a thread per request
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name='asyncio', daemon=True).start()
+        self._option_future = None  # The last direct-replacement request started by process_option
 
         # Setup available AI providers
         self.providers = [GeminiProvider(self), OpenAICompatibleProvider(self)]
@@ -66,15 +197,20 @@ class WritingToolApp(QtWidgets.QApplication):
                 logging.warning(f'Provider {provider_name} not found. Using default provider.')
                 self.current_provider = self.providers[0]
 
-            self.current_provider.load_config(self.config.get("providers", {}).get(provider_name, {}))
-
+            # The tray icon and hotkey come first; loading the provider imports its SDK, which is slow,
+            # so it runs once the event loop has started and the tray icon is up
             self.create_tray_icon()
             self.register_hotkey()
+            QtCore.QTimer.singleShot(0, lambda: self.current_provider.load_config(
+                self.config.get("providers", {}).get(self.current_provider.provider_name, {})))
             
             # Initialize update checker
             self.update_checker = UpdateChecker(self)
             self.update_checker.check_updates_async()
 
+            # Build the settings and about windows once startup has settled, so opening them is instant
+            QtCore.QTimer.singleShot(2000, self.preload_windows)
+
         self.recent_triggers = []  # Track recent hotkey triggers
         self.TRIGGER_WINDOW = 1.5  # Time window in seconds
         self.MAX_TRIGGERS = 3  # Max allowed triggers in window
@@ -100,12 +236,13 @@ class WritingToolApp(QtWidgets.QApplication):
         """
         Load the configuration file.
         """
-        self.config_path = os.path.join(os.path.dirname(sys.argv[0]), 'config.json')
+        self.config_path = os.path.join(_APP_DIR, 'config.json')
         logging.debug(f'Loading config from {self.config_path}')
         if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                self.config = parse_config(f.read())
                 logging.debug('Config loaded successfully')
+            self._saved_config_json = dump_config(self.config)
         else:
             logging.debug('Config file not found')
             self.config = None
@@ -113,11 +250,36 @@ class WritingToolApp(QtWidgets.QApplication):
     def save_config(self, config):
         """
         Save the configuration file.
+        Inside a config_transaction the write is deferred to the end of the transaction,
+        and it is skipped entirely when the file already holds the same config.
         """
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=4)
-            logging.debug('Config saved successfully')
         self.config = config
+        if self._config_transaction_depth:
+            self._config_save_pending = True
+            return
+
+        config_json = dump_config(config)
+        if config_json == self._saved_config_json:
+            logging.debug('Config unchanged, skipping save')
+            return
+        with open(self.config_path, 'wb') as f:
+            f.write(config_json)
+            logging.debug('Config saved successfully')
+        self._saved_config_json = config_json
+
+    @contextlib.contextmanager
+    def config_transaction(self):
+        """
+        Batch every save_config call made inside the block into a single write at the end.
+        """
+        self._config_transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._config_transaction_depth -= 1
+            if not self._config_transaction_depth and self._config_save_pending:
+                self._config_save_pending = False
+                self.save_config(self.config)
 
     def show_onboarding(self):
         """
@@ -128,25 +290,41 @@ class WritingToolApp(QtWidgets.QApplication):
         self.onboarding_window.close_signal.connect(self.exit_app)
         self.onboarding_window.show()
 
+    def start_windows_hotkey(self, shortcut):
+        """
+        Register the hotkey with Windows so it arrives as a WM_HOTKEY message instead of through a keyboard hook.
+        Returns False if it couldn't be registered.
+        """
+        if self.windows_hotkey is None:
+            self.windows_hotkey = WindowsHotkey(self.hotkey_triggered_signal.emit)
+            self.installNativeEventFilter(self.windows_hotkey)
+        if not self.windows_hotkey.register(shortcut):
+            return False
+        self.registered_hotkey = shortcut
+        return True
+
     def start_hotkey_listener(self):
         """
-        Create listener for hotkeys on Linux/Mac.
+        Create listener for hotkeys on Linux/Mac, and on Windows if RegisterHotKey can't take the shortcut.
         """
         orig_shortcut = self.config.get('shortcut', 'ctrl+space')
-        # Parse the shortcut string, for example ctrl+alt+h -> <ctrl>+<alt>+h
-        shortcut = '+'.join([f'{t}' if len(t) <= 1 else f'<{t}>' for t in orig_shortcut.split('+')])
-        logging.debug(f'Registering global hotkey for shortcut: {shortcut}')
+        if self.hotkey_listener is not None:
+            self.hotkey_listener.stop()
+            self.hotkey_listener = None
+        if sys.platform.startswith('win32'):
+            if self.start_windows_hotkey(orig_shortcut):
+                logging.debug(f'Registered Windows hotkey for shortcut: {orig_shortcut}')
+                return
+            logging.warning('Falling back to a keyboard listener for the hotkey')
+        logging.debug(f'Registering global hotkey for shortcut: {orig_shortcut}')
         try:
-            if self.hotkey_listener is not None:
-                self.hotkey_listener.stop()
-
             def on_activate():
                 logging.debug('triggered hotkey')
                 self.hotkey_triggered_signal.emit()  # Emit the signal when hotkey is pressed
 
             # Define the hotkey combination
             hotkey = pykeyboard.HotKey(
-                pykeyboard.HotKey.parse(shortcut),
+                list(parse_pynput_shortcut(orig_shortcut)),
                 on_activate
             )
             self.registered_hotkey = orig_shortcut
@@ -174,6 +352,7 @@ class WritingToolApp(QtWidgets.QApplication):
         self.start_hotkey_listener()
         logging.debug('Hotkey registered')
 
+    @Slot()
     def on_hotkey_pressed(self):
         """
         Handle the hotkey press event.
@@ -191,37 +370,33 @@ class WritingToolApp(QtWidgets.QApplication):
             logging.debug("Cancelling current provider's request")
             self.current_provider.cancel()
             self.output_queue = ""
+            self._typed_length = 0
+        if self._option_future is not None and not self._option_future.done():
+            self._option_future.cancel()
 
-        QtCore.QMetaObject.invokeMethod(self, "_show_popup", QtCore.Qt.ConnectionType.QueuedConnection)
+        # The clipboard manager copies the selection and answers with selection_ready
+        self.clipboard_manager.request_selection()
 
-    @Slot()
-    def _show_popup(self):
+    @Slot(str)
+    def _show_popup(self, selected_text):
         """
-        Show the popup window when the hotkey is pressed.
+        Show the popup window for the selection captured after the hotkey was pressed.
         """
         logging.debug('Showing popup window')
-        # First attempt with default sleep
-        selected_text = self.get_selected_text()
-
-        # Retry with longer sleep if no text captured
-        if not selected_text:
-            logging.debug('No text captured, retrying with longer sleep')
-            selected_text = self.get_selected_text(sleep_duration=0.5)
-
-        logging.debug(f'Selected text: "{selected_text}"')
         try:
-            if self.popup_window is not None:
-                logging.debug('Existing popup window found')
-                if self.popup_window.isVisible():
-                    logging.debug('Closing existing visible popup window')
-                    self.popup_window.close()
+            # The popup is built once and reused; only a theme change needs a new one
+            if self.popup_window is not None and self.popup_window.theme != self.config.get('theme', 'gradient'):
+                logging.debug('Theme changed, discarding existing popup window')
+                self.popup_window.close()
+                self.popup_window.deleteLater()
                 self.popup_window = None
-            logging.debug('Creating new popup window')
-            self.popup_window = CustomPopupWindow(self, selected_text)
+            if self.popup_window is None:
+                logging.debug('Creating new popup window')
+                self.popup_window = CustomPopupWindow(self, selected_text)
+            else:
+                logging.debug('Reusing existing popup window')
+                self.popup_window.set_selected_text(selected_text)
 
-            # Set the window icon
-            icon_path = os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'app_icon.png')
-            if os.path.exists(icon_path): self.setWindowIcon(QtGui.QIcon(icon_path))
             # Get the screen containing the cursor
             cursor_pos = QCursor.pos()
             screen = QGuiApplication.screenAt(cursor_pos)
@@ -234,6 +409,7 @@ class WritingToolApp(QtWidgets.QApplication):
             self.popup_window.show()
             self.popup_window.adjustSize()
             # Ensure the popup it's focused, even on lower-end machines
+            self.popup_window.raise_()
             self.popup_window.activateWindow()
             QtCore.QTimer.singleShot(100, self.popup_window.custom_input.setFocus)
 
@@ -253,130 +429,54 @@ class WritingToolApp(QtWidgets.QApplication):
         except Exception as e:
             logging.error(f'Error showing popup window: {e}', exc_info=True)
 
-    def get_selected_text(self, sleep_duration=0.2):
-        """
-        Get the currently selected text from any application.
-        Args:
-            sleep_duration (float): Time to wait for clipboard update
-        """
-        # Backup the clipboard
-        clipboard_backup = pyperclip.paste()
-        logging.debug(f'Clipboard backup: "{clipboard_backup}" (sleep: {sleep_duration}s)')
-
-        # Clear the clipboard
-        self.clear_clipboard()
-
-        # Simulate Ctrl+C
-        logging.debug('Simulating Ctrl+C')
-        kbrd = pykeyboard.Controller()
-
-        def press_ctrl_c():
-            kbrd.press(pykeyboard.Key.ctrl.value)
-            kbrd.press('c')
-            kbrd.release('c')
-            kbrd.release(pykeyboard.Key.ctrl.value)
-
-        press_ctrl_c()
-
-        # Wait for the clipboard to update
-        time.sleep(sleep_duration)
-        logging.debug(f'Waited {sleep_duration}s for clipboard')
-
-        # Get the selected text
-        selected_text = pyperclip.paste()
-        logging.debug(f'Selected text: "{selected_text}"')
-
-        # Restore the clipboard
-        pyperclip.copy(clipboard_backup)
-
-        return selected_text
-
-    @staticmethod
-    def clear_clipboard():
-        """
-        Clear the system clipboard.
-        """
-        try:
-            pyperclip.copy('')
-        except Exception as e:
-            logging.error(f'Error clearing clipboard: {e}')
-
     def process_option(self, option, selected_text, custom_change=None):
         """
         Process the selected writing option in a separate thread.
         """
         logging.debug(f'Processing option: {option}')
+        # Stripping copies the whole selection, so it is done once
+        has_text = bool(selected_text.strip())
         
         # For Summary, Key Points, Table, and empty text custom prompts, create response window
-        if option in ['Summary', 'Key Points', 'Table'] or (option == 'Custom' and not selected_text.strip()):
-            window_title = "Chat" if (option == 'Custom' and not selected_text.strip()) else option
+        window_request = option in _WINDOW_OPTIONS or (option == 'Custom' and not has_text)
+        if window_request:
+            window_title = "Chat" if (option == 'Custom' and not has_text) else option
             self.current_response_window = self.show_response_window(window_title, selected_text)
             
             # Initialize chat history with text/prompt
-            if option == 'Custom' and not selected_text.strip():
+            if option == 'Custom' and not has_text:
                 # For direct AI queries, don't include empty text
                 self.current_response_window.chat_history = []
             else:
                 # For other options, include the original text
                 self.current_response_window.chat_history = [
-                    {
-                        "role": "user",
-                        "content": f"Original text to {option.lower()}:\n\n{selected_text}"
-                    }
+                    ChatMsg("user", f"Original text to {option.lower()}:\n\n{selected_text}")
                 ]
         else:
             # Clear any existing response window reference for non-window options
             if hasattr(self, 'current_response_window'):
                 delattr(self, 'current_response_window')
                 
-        threading.Thread(target=self.process_option_thread, args=(option, selected_text, custom_change), daemon=True).start()
+        future = asyncio.run_coroutine_threadsafe(
+            self.process_option_async(option, selected_text, custom_change, has_text), self.loop)
+        if window_request:
+            # A window request has its own window to finish in, so it is never superseded
+            return
+        # A new replacement supersedes one still in flight, so two responses are never pasted over each other
+        if self._option_future is not None and not self._option_future.done():
+            logging.debug('Cancelling the previous request')
+            self._option_future.cancel()
+        self._option_future = future
 
-    def process_option_thread(self, option, selected_text, custom_change=None):
+    async def process_option_async(self, option, selected_text, custom_change=None, has_text=None):
             """
-            Thread function to process the selected writing option using the AI model.
+            Process the selected writing option using the AI model, on the app's asyncio loop.
             """
             logging.debug(f'Starting processing thread for option: {option}')
+            if has_text is None:
+                has_text = bool(selected_text.strip())
             try:
-                option_prompts = {
-                    'Proofread': (
-                        'Proofread this:\n\n',
-                        'You are a grammar proofreading assistant. Output ONLY the corrected text without any additional comments. Maintain the original text structure and writing style. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with this (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Rewrite': (
-                        'Rewrite this:\n\n',
-                        'You are a writing assistant. Rewrite the text provided by the user to improve phrasing. Output ONLY the rewritten text without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with proofreading (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Friendly': (
-                        'Make this more friendly:\n\n',
-                        'You are a writing assistant. Rewrite the text provided by the user to be more friendly. Output ONLY the friendly text without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with rewriting (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Professional': (
-                        'Make this more professional:\n\n',
-                        'You are a writing assistant. Rewrite the text provided by the user to sound more professional. Output ONLY the professional text without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with this (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Concise': (
-                        'Make this more concise:\n\n',
-                        'You are a writing assistant. Rewrite the text provided by the user to be slightly more concise in tone, thus making it just a bit shorter. Do not change the text too much or be too reductive. Output ONLY the concise version without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with this (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Summary': (
-                        'Summarize this:\n\n',
-                        'You are a summarisation assistant. Provide a succinct summary of the text provided by the user. The summary should be succinct yet encompass all the key insightful points. To make it quite legible and readable, you MUST use Markdown formatting (bold, italics, underline...). You should add line spacing between your paragraphs/lines. Only if appropriate, you could also use headings (only the very small ones), lists, tables, etc. Don\'t be repetitive or too verbose. Output ONLY the summary without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with summarisation (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Key Points': (
-                        'Extract key points from this:\n\n',
-                        'You are an assistant that extracts key points from text provided by the user. Output ONLY the key points without additional comments. You MUST use Markdown formatting (lists, bold, italics, underline, etc. as appropriate) to make it quite legible and readable. Don\'t be repetitive or too verbose. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is absolutely incompatible with extracting key points (e.g., totally random gibberish), output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Table': (
-                        'Convert this into a table:\n\n',
-                        'You are an assistant that converts text provided by the user into a Markdown table. Output ONLY the table without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text is completely incompatible with this with conversion, output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    ),
-                    'Custom': (
-                        'Make the following change to this text:\n\n',
-                        'You are a writing and coding assistant. You MUST make the user\'s described change to the text or code provided by the user. Output ONLY the appropriately modified text or code without additional comments. Respond in the same language as the input (e.g., English US, French). Do not answer or respond to the user\'s text content. If the text or code is absolutely incompatible with the requested change, output "ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST".'
-                    )
-                }
-
-                if selected_text.strip() == '':
+                if not has_text:
                     # No selected text
                     if option == 'Custom':
                         prompt = custom_change
@@ -385,7 +485,7 @@ class WritingToolApp(QtWidgets.QApplication):
                         self.show_message_signal.emit('Error', 'Please select text to use this option.')
                         return
                 else:
-                    prompt_prefix, system_instruction = option_prompts.get(option, ('', ''))
+                    prompt_prefix, system_instruction = _OPTION_PROMPTS.get(option, ('', ''))
                     if option == 'Custom':
                         prompt = f"{prompt_prefix}Described change: {custom_change}\n\nText: {selected_text}"
                     else:
@@ -394,20 +494,25 @@ class WritingToolApp(QtWidgets.QApplication):
                 self.output_queue = ""
 
                 logging.debug(f'Getting response from provider for option: {option}')
+                cache_key = self.response_cache_key(system_instruction, prompt)
+                response = self.get_cached_response(cache_key)
+                if response is not None:
+                    logging.debug('Using cached response')
                 
-                if option in ['Summary', 'Key Points', 'Table'] or (option == 'Custom' and not selected_text.strip()):
-                    logging.debug('Getting response for window display')
-                    response = self.current_provider.get_response(system_instruction, prompt, return_response=True)
-                    logging.debug(f'Got response of length: {len(response) if response else 0}')
+                if option in _WINDOW_OPTIONS or (option == 'Custom' and not has_text):
+                    if response is None:
+                        logging.debug('Streaming response for window display')
+                        response = await self.stream_to_window(self.current_response_window, system_instruction, prompt)
+                        logging.debug(f'Got response of length: {len(response)}')
+                        self.cache_response(cache_key, response)
                     
                     # For custom prompts with no text, add question to chat history
-                    if option == 'Custom' and not selected_text.strip():
-                        self.current_response_window.chat_history.append({
-                            "role": "user",
-                            "content": custom_change
-                        })
+                    if option == 'Custom' and not has_text:
+                        self.current_response_window.chat_history.append(ChatMsg("user", custom_change))
                     
-                    # Set initial response using QMetaObject.invokeMethod to ensure thread safety
+                    # Set initial response using QMetaObject.invokeMethod to ensure thread safety.
+                    # After streaming this is queued behind the last append_text, and set_text
+                    # discards any chunks the window hasn't rendered yet
                     if hasattr(self, 'current_response_window'):
                         QtCore.QMetaObject.invokeMethod(
                             self.current_response_window,
@@ -416,37 +521,224 @@ class WritingToolApp(QtWidgets.QApplication):
                             QtCore.Q_ARG(str, response)
                         )
                         logging.debug('Invoked set_text on response window')
+                elif response is None and self.config.get('streaming', False):
+                    logging.debug('Streaming response into the focused app')
+                    response = await self.stream_to_target(system_instruction, prompt)
+                    if response is not None:
+                        self.cache_response(cache_key, response)
                 else:
-                    logging.debug('Getting response for direct replacement')
-                    self.current_provider.get_response(system_instruction, prompt)
-                    logging.debug('Response processed')
+                    if response is None:
+                        logging.debug('Getting response for direct replacement')
+                        response = await self.current_provider.get_response_async(system_instruction, prompt)
+                        # The hotkey cancels by flagging the provider; the reply still arrives, but mustn't be pasted
+                        if self.current_provider.close_requested:
+                            logging.debug('Response cancelled')
+                            return
+                        logging.debug(f'Got response of length: {len(response) if response else 0}')
+                        self.cache_response(cache_key, response)
+                    self.output_ready_signal.emit(response)
 
             except Exception as e:
                 logging.error(f'An error occurred: {e}', exc_info=True)
                 self.show_message_signal.emit('Error', f'An error occurred: {e}')
 
+    def process_options_batch(self, options, selected_text):
+        """
+        Run several options on the same selected text at once, on the app's asyncio loop.
+        Returns a concurrent.futures.Future that resolves to one result per option, in the order of options:
+        the response, or the exception that option's request raised.
+        Custom needs a described change, so it can't be batched; nor can an empty selection.
+        """
+        if not selected_text.strip():
+            raise ValueError('Please select text to use these options.')
+        unsupported = [option for option in options if option == 'Custom' or option not in _OPTION_PROMPTS]
+        if unsupported:
+            raise ValueError(f'These options can\'t be batched: {", ".join(unsupported)}')
+        logging.debug(f'Processing options as a batch: {options}')
+        return asyncio.run_coroutine_threadsafe(self.process_options_batch_async(options, selected_text), self.loop)
+
+    async def process_options_batch_async(self, options, selected_text):
+        """
+        Request every option concurrently with asyncio.gather; cached responses are reused.
+        A failing option doesn't fail the batch: its exception is returned in its place.
+        """
+        async def get_option_response(option):
+            prompt_prefix, system_instruction = _OPTION_PROMPTS[option]
+            prompt = f"{prompt_prefix}{selected_text}"
+            cache_key = self.response_cache_key(system_instruction, prompt)
+            response = self.get_cached_response(cache_key)
+            if response is None:
+                response = await self.current_provider.get_response_async(system_instruction, prompt)
+                self.cache_response(cache_key, response)
+            return response
+
+        return await asyncio.gather(*(get_option_response(option) for option in options), return_exceptions=True)
+
+    async def stream_to_window(self, response_window, system_instruction, prompt):
+        """
+        Show the response in the window chunk by chunk as it arrives, and return the full response.
+        The hotkey's cancel doesn't stop it: nothing gets pasted from a window, and a window left
+        half-streamed would never be finalised.
+        """
+        chunks = []
+        async for chunk in self.current_provider.stream_response_async(system_instruction, prompt, cancellable=False):
+            chunks.append(chunk)
+            QtCore.QMetaObject.invokeMethod(
+                response_window,
+                'append_text',
+                QtCore.Qt.ConnectionType.QueuedConnection,
+                QtCore.Q_ARG(str, chunk)
+            )
+        return "".join(chunks).rstrip('\n')
+
+    async def stream_to_target(self, system_instruction, prompt):
+        """
+        Type the response into the focused app chunk by chunk as it arrives, replacing the selection.
+        Returns the full response, or None if the request was cancelled part way.
+        """
+        chunks = []
+        async for chunk in self.current_provider.stream_response_async(system_instruction, prompt):
+            chunks.append(chunk)
+            self.typed_output_signal.emit(chunk)
+        if self.current_provider.close_requested:
+            return None
+        self.typed_output_done_signal.emit()
+        return "".join(chunks).rstrip('\n')
+
+    def response_cache_key(self, system_instruction, prompt):
+        """
+        Key a request by the current provider and a digest of what is sent, so large selections aren't kept twice.
+        Line endings and surrounding whitespace don't count, as copying the same text from different apps varies in them.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(system_instruction.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(prompt.replace('\r\n', '\n').strip().encode('utf-8'))
+        return self.current_provider.provider_name, digest.hexdigest()
+
+    def get_cached_response(self, key):
+        """
+        Return the cached response for the key, or None.
+        """
+        with self._response_cache_lock:
+            response = self._response_cache.get(key)
+            if response is not None:
+                self._response_cache.move_to_end(key)
+            return response
+
+    def cache_response(self, key, response):
+        """
+        Remember a response, dropping the least recently used one past RESPONSE_CACHE_SIZE. Empty responses aren't kept.
+        """
+        if not response:
+            return
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            self._response_cache_dirty = True
+
+    @Slot()
+    def forget_cached_responses(self):
+        """
+        Forget the cached AI responses held in memory. The saved file is left alone.
+        """
+        with self._response_cache_lock:
+            self._response_cache.clear()
+            self._response_cache_dirty = False
+
+    def clear_response_cache(self):
+        """
+        Forget all cached AI responses, including the ones saved from earlier runs.
+        """
+        logging.debug('Clearing response cache')
+        self.forget_cached_responses()
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(_APP_DIR, RESPONSE_CACHE_FILE))
+
+    def load_response_cache(self):
+        """
+        Load the responses saved by the last run, least recently used first.
+        Only done when the user opted in to keeping responses on disk.
+        """
+        if not (self.config or {}).get('persist_response_cache', False):
+            return
+        path = os.path.join(_APP_DIR, RESPONSE_CACHE_FILE)
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'rb') as f:
+                entries = parse_config(f.read())
+            loaded = OrderedDict(((provider_name, digest), response)
+                                 for provider_name, digest, response in entries[-RESPONSE_CACHE_SIZE:])
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning(f'Ignoring unreadable response cache: {e}')
+            return
+        with self._response_cache_lock:
+            # Anything cached since startup is more recent than the saved responses
+            for key, response in self._response_cache.items():
+                loaded[key] = response
+                loaded.move_to_end(key)
+            while len(loaded) > RESPONSE_CACHE_SIZE:
+                loaded.popitem(last=False)
+            self._response_cache = loaded
+        logging.debug(f'Loaded {len(loaded)} cached responses')
+
+    def save_response_cache(self):
+        """
+        Write the cached responses next to the config, if they changed during this run.
+        With persistence turned off, a file left by an earlier run is removed instead.
+        """
+        path = os.path.join(_APP_DIR, RESPONSE_CACHE_FILE)
+        if not (self.config or {}).get('persist_response_cache', False):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            return
+        with self._response_cache_lock:
+            if not self._response_cache_dirty:
+                return
+            entries = [[provider_name, digest, response] for (provider_name, digest), response in self._response_cache.items()]
+            self._response_cache_dirty = False
+        try:
+            with open(path, 'wb') as f:
+                f.write(dump_config(entries))
+            logging.debug('Response cache saved')
+        except OSError as e:
+            logging.warning(f'Could not save the response cache: {e}')
+
     @Slot(str, str)
     def show_message_box(self, title, message):
         """
-        Show a message box with the given title and message.
+        Show a warning without blocking the event loop: as a tray notification when the tray supports them,
+        otherwise in a non-modal message box.
         """
-        QMessageBox.warning(None, title, message)
+        if self.tray_icon is not None and self.tray_icon.isVisible() and QtWidgets.QSystemTrayIcon.supportsMessages():
+            self.tray_icon.showMessage(title, message, QtWidgets.QSystemTrayIcon.MessageIcon.Warning, 5000)
+            return
+
+        message_box = QMessageBox(QMessageBox.Icon.Warning, title, message)
+        message_box.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        # Keep a reference while it is open; it has no parent to keep it alive
+        self.message_boxes.append(message_box)
+        message_box.finished.connect(lambda _result: self.message_boxes.remove(message_box))
+        message_box.show()
 
     def show_response_window(self, option, text):
         """
         Show the response in a new window instead of pasting it.
         """
-        from ui.ResponseWindow import ResponseWindow
         response_window = ResponseWindow(self, f"{option} Result")
         response_window.selected_text = text  # Store the text for regeneration
         response_window.show()
         return response_window
 
+    @Slot(str)
     def replace_text(self, new_text):
         """
         Replaces the text by pasting in the LLM generated text. With "Key Points" and "Summary", invokes a window with the output instead.
         """
-        error_message = 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'
+        error_message = ERROR_TEXT_INCOMPATIBLE
 
         # Confirm new_text exists and is a string
         if new_text and isinstance(new_text, str):
@@ -461,8 +753,7 @@ class WritingToolApp(QtWidgets.QApplication):
             # Check if we're building up to the error message (to prevent partial pasting)
             if len(current_output) <= len(error_message):
                 clean_current = ''.join(current_output.split())
-                clean_error = ''.join(error_message.split())
-                if clean_current == clean_error[:len(clean_current)]:
+                if error_message.startswith(clean_current):
                     return
 
             logging.debug('Processing output text')
@@ -473,26 +764,12 @@ class WritingToolApp(QtWidgets.QApplication):
                     
                     # If this is the initial response, add it to chat history
                     if len(self.current_response_window.chat_history) == 1:  # Only original text exists
-                        self.current_response_window.chat_history.append({
-                            "role": "assistant",
-                            "content": self.output_queue.rstrip('\n')
-                        })
+                        self.current_response_window.chat_history.append(
+                            ChatMsg("assistant", self.output_queue.rstrip('\n'))
+                        )
                 else:
                     # For other options, use the original clipboard-based replacement
-                    clipboard_backup = pyperclip.paste()
-                    cleaned_text = self.output_queue.rstrip('\n')
-                    pyperclip.copy(cleaned_text)
-                    
-                    kbrd = pykeyboard.Controller()
-                    def press_ctrl_v():
-                        kbrd.press(pykeyboard.Key.ctrl.value)
-                        kbrd.press('v')
-                        kbrd.release('v')
-                        kbrd.release(pykeyboard.Key.ctrl.value)
-
-                    press_ctrl_v()
-                    time.sleep(0.2)
-                    pyperclip.copy(clipboard_backup)
+                    self.clipboard_manager.request_paste(self.output_queue.rstrip('\n'))
 
                 if not hasattr(self, 'current_response_window'):
                     self.output_queue = ""
@@ -502,6 +779,41 @@ class WritingToolApp(QtWidgets.QApplication):
         else:
             logging.debug('No new text to process')
 
+    def _could_be_error_text(self):
+        """
+        Whether the output so far is, or could still turn into, the incompatible-text error message.
+        """
+        current_output = ''.join(self.output_queue.split())
+        return len(current_output) <= len(ERROR_TEXT_INCOMPATIBLE) and ERROR_TEXT_INCOMPATIBLE.startswith(current_output)
+
+    @Slot(str)
+    def type_text_chunk(self, chunk):
+        """
+        Type the part of the streamed response that is safe to show, without going through the clipboard.
+        """
+        self.output_queue += chunk
+        # Hold back anything that might still be the error message
+        if not self._typed_length and self._could_be_error_text():
+            return
+        # Trailing newlines are held back too, since the finished response has them stripped
+        end = len(self.output_queue.rstrip('\n'))
+        if end > self._typed_length:
+            self.clipboard_manager.type_text(self.output_queue[self._typed_length:end])
+            self._typed_length = end
+
+    @Slot()
+    def finish_typed_output(self):
+        """
+        Finish a streamed response: report the error message, or type a short response that was held back.
+        """
+        if not self._typed_length and self.output_queue.strip():
+            if self.output_queue.strip() == ERROR_TEXT_INCOMPATIBLE:
+                self.show_message_signal.emit('Error', 'The text is incompatible with the requested change.')
+            else:
+                self.clipboard_manager.type_text(self.output_queue.rstrip('\n'))
+        self.output_queue = ""
+        self._typed_length = 0
+
     def create_tray_icon(self):
         """
         Create the system tray icon for the application.
@@ -511,23 +823,26 @@ class WritingToolApp(QtWidgets.QApplication):
             return
 
         logging.debug('Creating system tray icon')
-        icon_path = os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'app_icon.png')
-        if not os.path.exists(icon_path):
-            logging.warning(f'Tray icon not found at {icon_path}')
+        if UIUtils.app_icon().isNull():
+            logging.warning(f'Tray icon not found at {_APP_ICON_PATH}')
             # Use a default icon if not found
             self.tray_icon = QtWidgets.QSystemTrayIcon(self)
         else:
-            self.tray_icon = QtWidgets.QSystemTrayIcon(QtGui.QIcon(icon_path), self)
+            self.tray_icon = QtWidgets.QSystemTrayIcon(UIUtils.app_icon(), self)
         # Set the tooltip (hover name) for the tray icon
         self.tray_icon.setToolTip("WritingTools")
         tray_menu = QtWidgets.QMenu()
+        self.tray_menu = tray_menu
 
-        # Apply dark mode styles using darkdetect
-        self.apply_dark_mode_styles(tray_menu)
+        # Apply dark mode styles for the current system theme
+        self.apply_dark_mode_styles(tray_menu, self.is_dark_theme())
 
         settings_action = tray_menu.addAction('Settings')
         settings_action.triggered.connect(self.show_settings)
 
+        clear_cache_action = tray_menu.addAction('Clear Response Cache')
+        clear_cache_action.triggered.connect(self.clear_response_cache)
+
         about_action = tray_menu.addAction('About')
         about_action.triggered.connect(self.show_about)
 
@@ -538,15 +853,54 @@ class WritingToolApp(QtWidgets.QApplication):
         self.tray_icon.show()
         logging.debug('Tray icon displayed')
 
+    def is_dark_theme(self):
+        """
+        Whether the system theme is dark, from Qt's style hints where available (Qt 6.5+).
+        Falls back to darkdetect: the result probed at startup, kept current by its listener.
+        """
+        if hasattr(QtCore.Qt, 'ColorScheme'):
+            scheme = self.styleHints().colorScheme()
+            if scheme != QtCore.Qt.ColorScheme.Unknown:
+                return scheme == QtCore.Qt.ColorScheme.Dark
+        return self._system_dark
+
+    def _listen_for_theme_changes(self):
+        """
+        Block on darkdetect's listener and forward theme switches to the GUI thread.
+        """
+        try:
+            darkdetect.listener(lambda theme: self.theme_changed.emit(theme == 'Dark'))
+        except Exception as e:  # not every platform/desktop supports listening
+            logging.debug(f'Theme change listener unavailable: {e}')
+
+    @Slot(bool)
+    def on_system_theme_changed(self, is_dark):
+        """
+        Record a theme switch reported by darkdetect and restyle the tray menu.
+        """
+        self._system_dark = is_dark
+        self.on_color_scheme_changed(None)
+
+    def on_color_scheme_changed(self, scheme):
+        """
+        Restyle the tray menu when the OS switches between light and dark.
+        """
+        if self.tray_menu is not None:
+            self.apply_dark_mode_styles(self.tray_menu, self.is_dark_theme())
+
     @staticmethod
-    def apply_dark_mode_styles(menu):
+    def apply_dark_mode_styles(menu, is_dark):
         """
-        Apply styles to the tray menu based on system theme using darkdetect.
+        Apply styles to the tray menu for a dark or light system theme.
+        The palette for each theme is built once and reused.
         """
-        is_dark_mode = darkdetect.isDark()
+        palette = WritingToolApp._tray_palettes.get(is_dark)
+        if palette is not None:
+            menu.setPalette(palette)
+            return
         palette = menu.palette()
 
-        if is_dark_mode:
+        if is_dark:
             logging.debug('Tray icon dark')
             # Dark mode colors
             palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#2d2d2d"))  # Dark background
@@ -557,6 +911,7 @@ class WritingToolApp(QtWidgets.QApplication):
             palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#ffffff"))  # Light background
             palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#000000"))  # Black text
 
+        WritingToolApp._tray_palettes[is_dark] = palette
         menu.setPalette(palette)
 
 
@@ -616,10 +971,7 @@ class WritingToolApp(QtWidgets.QApplication):
                     return
 
                 # Add current question to chat history
-                response_window.chat_history.append({
-                    "role": "user",
-                    "content": question
-                })
+                response_window.chat_history.append(ChatMsg("user", question))
                 
                 # Get chat history
                 history = response_window.chat_history.copy()
@@ -636,10 +988,10 @@ class WritingToolApp(QtWidgets.QApplication):
                     
                     # Convert our roles to Gemini's expected roles
                     for msg in history:
-                        gemini_role = "model" if msg["role"] == "assistant" else "user"
+                        gemini_role = "model" if msg.role == "assistant" else "user"
                         chat_messages.append({
                             "role": gemini_role,
-                            "parts": msg["content"]
+                            "parts": msg.content
                         })
                     
                     # Start chat with history
@@ -659,8 +1011,8 @@ class WritingToolApp(QtWidgets.QApplication):
                     # Add history messages (including latest question)
                     for msg in history:
                         # Convert 'assistant' role to 'assistant' for OpenAI
-                        role = "assistant" if msg["role"] == "assistant" else "user"
-                        messages.append({"role": role, "content": msg["content"]})
+                        role = "assistant" if msg.role == "assistant" else "user"
+                        messages.append({"role": role, "content": msg.content})
                     
                     # Get response by passing the full messages array
                     response_text = self.current_provider.get_response(
@@ -672,10 +1024,7 @@ class WritingToolApp(QtWidgets.QApplication):
                 logging.debug(f'Got response of length: {len(response_text)}')
                 
                 # Add response to chat history
-                response_window.chat_history.append({
-                    "role": "assistant",
-                    "content": response_text
-                })
+                response_window.chat_history.append(ChatMsg("assistant", response_text))
                 
                 # Emit response via signal
                 self.followup_response_signal.emit(response_text)
@@ -685,20 +1034,37 @@ class WritingToolApp(QtWidgets.QApplication):
                 self.show_message_signal.emit('Error', f'An error occurred: {e}')
                 self.followup_response_signal.emit("An error occurred while processing your question.")
                 
-        # Start the thread
-        threading.Thread(target=process_thread, daemon=True).start()
+        # Run it on the asyncio loop's worker pool rather than a new thread per question
+        asyncio.run_coroutine_threadsafe(asyncio.to_thread(process_thread), self.loop)
 
+    @Slot()
     def show_settings(self, providers_only=False):
 
         """
         Show the settings window.
         """
         logging.debug('Showing settings window')
-        # Always create a new settings window to handle providers_only correctly
-        self.settings_window = SettingsWindow(self, providers_only=providers_only)
+        # The full settings window is reused across opens; the providers-only one is a fresh, one-off window
+        if providers_only or self.settings_window is None or self.settings_window.built_providers_only:
+            self.settings_window = SettingsWindow(self, providers_only=providers_only)
+        else:
+            self.settings_window.reload_config()
         self.settings_window.show()
 
 
+    @Slot()
+    def preload_windows(self):
+        """
+        Construct the settings and about windows without showing them.
+        Widgets have to be created on the GUI thread, so this runs from a timer rather than a worker.
+        """
+        logging.debug('Preloading settings and about windows')
+        if self.settings_window is None:
+            self.settings_window = SettingsWindow(self)
+        if self.about_window is None:
+            self.about_window = AboutWindow()
+
+    @Slot()
     def show_about(self):
         """
         Show the about window.
@@ -708,6 +1074,7 @@ class WritingToolApp(QtWidgets.QApplication):
             self.about_window = AboutWindow()
         self.about_window.show()
 
+    @Slot()
     def exit_app(self):
         """
         Exit the application.
@@ -715,5 +1082,9 @@ class WritingToolApp(QtWidgets.QApplication):
         logging.debug('Stopping the listener')
         if self.hotkey_listener is not None:
             self.hotkey_listener.stop()
+        if self.windows_hotkey is not None:
+            self.windows_hotkey.unregister()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.save_response_cache()
         logging.debug('Exiting application')
         self.quit()
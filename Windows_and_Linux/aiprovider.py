@@ -34,17 +34,18 @@ Chat/History Handling:
 - Both maintain conversation context (until the Window is closed) for follow-up questions
 """
 
+import asyncio
+import functools
 import logging
+import threading
 import webbrowser
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-import google.generativeai as genai
-from google.generativeai.types import HarmBlockThreshold, HarmCategory
-from openai import OpenAI
 from PySide6 import QtWidgets
 from PySide6.QtWidgets import QVBoxLayout
-from ui.UIUtils import colorMode
+
+WARM_UP_TIMEOUT = 10  # Seconds a warm-up request may take before its thread gives up
 
 
 class AIProviderSetting(ABC):
@@ -76,17 +77,11 @@ class TextSetting(AIProviderSetting):
     def render_to_layout(self, layout: QVBoxLayout):
         row_layout = QtWidgets.QHBoxLayout()
         label = QtWidgets.QLabel(self.display_name)
-        label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        label.setObjectName("setting_label")
         row_layout.addWidget(label)
 
         self.input = QtWidgets.QLineEdit(self.internal_value)
-        self.input.setStyleSheet(f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-        """)
+        self.input.setObjectName("setting_input")
 
         self.input.setPlaceholderText(self.description)
 
@@ -119,6 +114,35 @@ class AIProvider(ABC):
         """
         pass
 
+    def stream_response(self, system_instruction: str, prompt: str, cancellable: bool = True) -> Iterator[str]:
+        """
+        Yield the response in chunks as they arrive. Stops early if cancel() is called,
+        leaving close_requested set so the caller can tell the response is incomplete.
+        With cancellable=False the stream runs to the end regardless (the hotkey's cancel is
+        meant for text about to be pasted, not for a response window).
+        Providers without streaming support yield the whole response at once.
+        """
+        self.close_requested = False
+        yield self.get_response(system_instruction, prompt, return_response=True)
+
+    async def get_response_async(self, system_instruction: str, prompt: str) -> str:
+        """
+        Return the complete response from the app's asyncio loop.
+        Providers without a native async API run get_response in a worker thread.
+        """
+        return await asyncio.to_thread(self.get_response, system_instruction, prompt, return_response=True)
+
+    async def stream_response_async(self, system_instruction: str, prompt: str,
+                                    cancellable: bool = True) -> AsyncIterator[str]:
+        """
+        Async version of stream_response. Providers without a native async API
+        pull each chunk of stream_response in a worker thread.
+        """
+        chunks = iter(self.stream_response(system_instruction, prompt, cancellable))
+        done = object()
+        while (chunk := await asyncio.to_thread(next, chunks, done)) is not done:
+            yield chunk
+
     def load_config(self, config: dict):
         """
         Load the configuration into this provider's memory.
@@ -131,23 +155,45 @@ class AIProvider(ABC):
             else:
                 setattr(self, setting.name, setting.default_value)
 
-        self.after_load()
+        # Only a freshly built client has a connection left to open
+        if self.after_load():
+            threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _warm_up(self):
+        try:
+            self.warm_up()
+        except Exception as e:
+            logging.debug(f'{self.provider_name} warm-up request failed: {e}')
+
+    def warm_up(self):
+        """
+        Called on a background thread after the settings have been loaded.
+        Providers can make a cheap request here so the first real one doesn't pay for connection setup.
+        """
+        pass
 
     def save_config(self):
         """
         Save the provider's memory to the config, and then save the config to disk.
+        Nothing is written if none of the settings changed. Returns whether anything was written.
         """
         config = {}
         for setting in self.settings:
             config[setting.name] = setting.get_value()
 
-        self.app.config["providers"][self.provider_name] = config
+        providers_config = self.app.config.setdefault("providers", {})
+        if providers_config.get(self.provider_name) == config:
+            logging.debug(f'{self.provider_name} settings unchanged')
+            return False
+        providers_config[self.provider_name] = config
         self.app.save_config(self.app.config)
+        return True
 
     @abstractmethod
-    def after_load(self):
+    def after_load(self) -> bool:
         """
         A method to be overridden by subclasses that is called after the settings have been loaded.
+        Returns whether the client was (re)built, in which case it is warmed up.
         """
         pass
 
@@ -166,6 +212,21 @@ class AIProvider(ABC):
         """
         pass
 
+@functools.lru_cache(maxsize=None)
+def _gemini_safety_settings():
+    """
+    Safety thresholds for every Gemini model, built once after the SDK has been imported.
+    """
+    from google.generativeai.types import HarmBlockThreshold, HarmCategory
+
+    return {
+        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+    }
+
+
 class GeminiProvider(AIProvider):
     def __init__(self, app):
         """
@@ -173,6 +234,7 @@ class GeminiProvider(AIProvider):
         """
         self.close_requested = False
         self.model = None
+        self._model_key = None  # (api_key, model_name) the current model was built with
 
         settings = [
             TextSetting(name="api_key", display_name="API Key", description="Paste your Gemini API key here"),
@@ -233,10 +295,38 @@ class GeminiProvider(AIProvider):
         
         return ""  # Default return for streaming mode
 
+    def stream_response(self, system_instruction: str, prompt: str, cancellable: bool = True) -> Iterator[str]:
+        self.close_requested = False
+
+        response = self.model.generate_content(
+            contents=[system_instruction, prompt],
+            stream=True
+        )
+
+        for chunk in response:
+            if cancellable and self.close_requested:
+                break
+            # Check if the response was blocked
+            if chunk.prompt_feedback.block_reason:
+                logging.warning('Response was blocked due to safety settings')
+                self.app.show_message_signal.emit('Content Blocked',
+                                            'The generated content was blocked due to safety settings.')
+                return
+            # A chunk can carry only a finish reason and no text
+            if chunk.parts:
+                yield chunk.text
+
     def after_load(self):
-        genai.configure(api_key=self.api_key)
+        # Saving settings reloads the config; keep the model (and its open channel) if nothing it uses changed
+        model_key = (self.api_key, self.model_name)
+        if self.model is not None and model_key == self._model_key:
+            return False
+        self._model_key = model_key
+
+        # The SDK pulls in grpc and protobuf, so it is only imported once Gemini is actually used
+        import google.generativeai as genai
 
-        system_instruction = "You are a helpful AI assistant. Provide clear and direct responses, maintaining the same format and style as your previous responses. If appropriate, use Markdown formatting to make your response more readable."
+        genai.configure(api_key=self.api_key)
 
         self.model = genai.GenerativeModel(
             model_name=self.model_name,
@@ -245,14 +335,56 @@ class GeminiProvider(AIProvider):
                 max_output_tokens=1000,
                 temperature=0.5
             ),
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            }
+            safety_settings=_gemini_safety_settings()
+        )
+        return True
+
+    async def get_response_async(self, system_instruction: str, prompt: str) -> str:
+        self.close_requested = False
+
+        response = await self.model.generate_content_async(contents=[system_instruction, prompt])
+
+        # Check if the response was blocked
+        if response.prompt_feedback.block_reason:
+            logging.warning('Response was blocked due to safety settings')
+            self.app.show_message_signal.emit('Content Blocked',
+                                        'The generated content was blocked due to safety settings.')
+            return ""
+        return response.text.rstrip('\n')
+
+    async def stream_response_async(self, system_instruction: str, prompt: str,
+                                    cancellable: bool = True) -> AsyncIterator[str]:
+        self.close_requested = False
+
+        response = await self.model.generate_content_async(
+            contents=[system_instruction, prompt],
+            stream=True
         )
 
+        async for chunk in response:
+            if cancellable and self.close_requested:
+                break
+            # Check if the response was blocked
+            if chunk.prompt_feedback.block_reason:
+                logging.warning('Response was blocked due to safety settings')
+                self.app.show_message_signal.emit('Content Blocked',
+                                            'The generated content was blocked due to safety settings.')
+                return
+            # A chunk can carry only a finish reason and no text
+            if chunk.parts:
+                yield chunk.text
+
+    def warm_up(self):
+        if not self.api_key:
+            return
+        # count_tokens_async goes through the same async gRPC channel as the requests on the app's loop
+        # and is free, so the TLS handshake is done before the first real request
+        future = asyncio.run_coroutine_threadsafe(self.model.count_tokens_async("ping"), self.app.loop)
+        try:
+            future.result(timeout=WARM_UP_TIMEOUT)
+        finally:
+            future.cancel()  # Stops a stalled request on the loop after a timeout; no-op once done
+
     def before_load(self):
         self.model = None
 
@@ -269,17 +401,11 @@ class DropdownSetting(AIProviderSetting):
     def render_to_layout(self, layout: QVBoxLayout):
         row_layout = QtWidgets.QHBoxLayout()
         label = QtWidgets.QLabel(self.display_name)
-        label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        label.setObjectName("setting_label")
         row_layout.addWidget(label)
 
         self.dropdown = QtWidgets.QComboBox()
-        self.dropdown.setStyleSheet(f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-        """)
+        self.dropdown.setObjectName("setting_input")
         
         for option, value in self.options:
             self.dropdown.addItem(option, value)
@@ -331,20 +457,9 @@ class OpenAICompatibleProvider(AIProvider):
         self.close_requested = False
         streaming = self.app.config.get("streaming", False) and not return_response
 
-        # Handle different prompt types
-        if isinstance(prompt, list):
-            # It's a messages array for chat
-            messages = prompt
-        else:
-            # It's a regular prompt string
-            messages = [
-                {"role": "system", "content": system_instruction},
-                {"role": "user", "content": prompt}
-            ]
-
         response = self.client.chat.completions.create(
             model=self.api_model,
-            messages=messages,
+            messages=self._build_messages(system_instruction, prompt),
             temperature=0.5,
             stream=streaming
         )
@@ -379,8 +494,50 @@ class OpenAICompatibleProvider(AIProvider):
                 
             return response_text
 
+    def stream_response(self, system_instruction: str, prompt: str, cancellable: bool = True) -> Iterator[str]:
+        self.close_requested = False
+
+        response = self.client.chat.completions.create(
+            model=self.api_model,
+            messages=self._build_messages(system_instruction, prompt),
+            temperature=0.5,
+            stream=True
+        )
+
+        try:
+            for chunk in response:
+                if cancellable and self.close_requested:
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            response.close()
+
+    @staticmethod
+    def _build_messages(system_instruction, prompt):
+        # Handle different prompt types
+        if isinstance(prompt, list):
+            # It's a messages array for chat
+            return prompt
+        # It's a regular prompt string
+        return [
+            {"role": "system", "content": system_instruction},
+            {"role": "user", "content": prompt}
+        ]
+
     def after_load(self):
-        self.client = OpenAI(api_key=self.api_key, base_url=self.api_base, organization=self.api_organisation, project=self.api_project)
+        # Imported on first use, like the Gemini SDK, so startup doesn't pay for the provider that isn't picked
+        import httpx
+        from openai import DefaultHttpxClient, OpenAI
+
+        # Keep idle connections around for a while, so a request after a pause reuses the TLS session
+        http_client = DefaultHttpxClient(limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300))
+        self.client = OpenAI(api_key=self.api_key, base_url=self.api_base, organization=self.api_organisation, project=self.api_project, http_client=http_client)
+        return True
+
+    def warm_up(self):
+        # Any request opens the pooled connection; listing models is cheap and doesn't use tokens
+        self.client.models.list(timeout=WARM_UP_TIMEOUT)
 
     def before_load(self):
         self.client = None
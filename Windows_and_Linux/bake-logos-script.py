@@ -0,0 +1,34 @@
+"""
+Bakes the rounded provider logos shown in the settings window, so the app can load them as is
+instead of rounding them with QPainter at runtime. The app falls back to rounding the original
+icon when a baked copy is missing, so this only needs re-running after a provider_*.png changes.
+
+Run from this directory: python bake-logos-script.py
+"""
+import glob
+import os
+import sys
+
+from PySide6.QtGui import QGuiApplication, QPixmap
+
+from ui.UIUtils import PROVIDER_LOGO_ROUNDING, PROVIDER_LOGO_SIZE, UIUtils
+
+
+def bake_provider_logos():
+    icons_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
+    baked_suffix = f"_{PROVIDER_LOGO_SIZE}x{PROVIDER_LOGO_ROUNDING}.png"
+    for logo_path in sorted(glob.glob(os.path.join(icons_dir, 'provider_*.png'))):
+        if logo_path.endswith(baked_suffix):
+            continue
+        baked_path = UIUtils.baked_image_path(logo_path, PROVIDER_LOGO_SIZE, PROVIDER_LOGO_ROUNDING)
+        pixmap = UIUtils.resize_and_round_image(QPixmap(logo_path), PROVIDER_LOGO_SIZE, PROVIDER_LOGO_ROUNDING)
+        if not pixmap.save(baked_path):
+            print(f"Failed to write {baked_path}")
+            sys.exit(1)
+        print(f"Baked {os.path.basename(baked_path)}")
+
+
+if __name__ == "__main__":
+    # QPainter and QPixmap need a GUI application, but no window is shown
+    app = QGuiApplication(sys.argv)
+    bake_provider_logos()
@@ -0,0 +1,189 @@
+import ctypes
+import logging
+import sys
+
+from pynput import keyboard as pykeyboard
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+from PySide6.QtGui import QGuiApplication
+
+SELECTION_TIMEOUTS = (200, 500)  # Milliseconds to wait for a copied selection, per attempt
+CLIPBOARD_RESTORE_DELAY = 200  # Milliseconds the target app gets to read a pasted clipboard before it is restored
+
+if sys.platform.startswith("win32"):
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    VK_CONTROL = 0x11
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [('wVk', wintypes.WORD), ('wScan', wintypes.WORD), ('dwFlags', wintypes.DWORD),
+                    ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+    class _MOUSEINPUT(ctypes.Structure):
+        # Only here so the union, and so INPUT, has the size SendInput expects
+        _fields_ = [('dx', wintypes.LONG), ('dy', wintypes.LONG), ('mouseData', wintypes.DWORD),
+                    ('dwFlags', wintypes.DWORD), ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [('ki', _KEYBDINPUT), ('mi', _MOUSEINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _anonymous_ = ('u',)
+        _fields_ = [('type', wintypes.DWORD), ('u', _INPUTUNION)]
+
+    def _send_ctrl_shortcut(virtual_key):
+        """
+        Send Ctrl+key as a single SendInput batch, so no other keystroke can land in between.
+        Returns False if Windows didn't take all four events (e.g. blocked by UIPI).
+        """
+        events = (_INPUT * 4)(
+            _INPUT(type=INPUT_KEYBOARD, ki=_KEYBDINPUT(wVk=VK_CONTROL)),
+            _INPUT(type=INPUT_KEYBOARD, ki=_KEYBDINPUT(wVk=virtual_key)),
+            _INPUT(type=INPUT_KEYBOARD, ki=_KEYBDINPUT(wVk=virtual_key, dwFlags=KEYEVENTF_KEYUP)),
+            _INPUT(type=INPUT_KEYBOARD, ki=_KEYBDINPUT(wVk=VK_CONTROL, dwFlags=KEYEVENTF_KEYUP)),
+        )
+        return _user32.SendInput(len(events), events, ctypes.sizeof(_INPUT)) == len(events)
+else:
+    _send_ctrl_shortcut = None
+
+
+class ClipboardManager(QObject):
+    """
+    Does the clipboard round trips for copying the selection and pasting results through QClipboard.
+    Everything runs on the GUI thread (QClipboard requires it), but nothing blocks: the copied
+    selection is picked up from QClipboard.dataChanged, and timeouts and restores run on timers.
+    """
+    # Emitted with the captured selection (empty if nothing was selected)
+    selection_ready = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clipboard = QGuiApplication.clipboard()
+        self.keyboard = pykeyboard.Controller()
+
+        # Selection capture: the user's clipboard while we copy, and the timeouts of the attempts left
+        self._selection_backup = None
+        self._capture_timeouts = []
+        self._capture_timer = QTimer(self)
+        self._capture_timer.setSingleShot(True)
+        self._capture_timer.timeout.connect(self._on_capture_timeout)
+        self.clipboard.dataChanged.connect(self._on_clipboard_changed)
+
+        # After a paste, the user's clipboard is put back from a timer
+        self._clipboard_backup = None
+        self._pasted_text = None
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.setInterval(CLIPBOARD_RESTORE_DELAY)
+        self._restore_timer.timeout.connect(self._restore_clipboard)
+
+    def _press_ctrl(self, key):
+        # On Windows the whole shortcut goes out in one SendInput call; the letter's virtual-key code is its uppercase ASCII code
+        if _send_ctrl_shortcut is not None and _send_ctrl_shortcut(ord(key.upper())):
+            return
+        self.keyboard.press(pykeyboard.Key.ctrl.value)
+        self.keyboard.press(key)
+        self.keyboard.release(key)
+        self.keyboard.release(pykeyboard.Key.ctrl.value)
+
+    def request_selection(self):
+        """
+        Copy the current selection; the result arrives through selection_ready.
+        """
+        if self._capture_timer.isActive():
+            logging.debug('Selection capture already running')
+            return
+        # Backup the clipboard
+        self._selection_backup = self._text_backup()
+        self._capture_timeouts = list(SELECTION_TIMEOUTS)
+        self._start_capture()
+
+    def _text_backup(self):
+        """
+        The clipboard text to put back later, or None if the clipboard holds no text (e.g. an image).
+        Only text is restored, so there is no point reading anything else.
+        """
+        if not self.clipboard.mimeData().hasText():
+            logging.debug('Clipboard holds no text, not backing it up')
+            return None
+        backup = self.clipboard.text()
+        logging.debug('Clipboard backed up (%d characters)', len(backup))
+        return backup
+
+    def _start_capture(self):
+        timeout = self._capture_timeouts.pop(0)
+        # Clear the clipboard, so any text showing up in it is the selection
+        self.clipboard.clear()
+
+        logging.debug(f'Simulating Ctrl+C (timeout: {timeout}ms)')
+        self._press_ctrl('c')
+        self._capture_timer.start(timeout)
+
+    @Slot()
+    def _on_clipboard_changed(self):
+        if not self._capture_timer.isActive():
+            return
+        text = self.clipboard.text()
+        if text:
+            self._finish_capture(text)
+
+    @Slot()
+    def _on_capture_timeout(self):
+        # Not every platform reports changes made by other apps, so look once more before giving up
+        text = self.clipboard.text()
+        if text or not self._capture_timeouts:
+            self._finish_capture(text)
+        else:
+            logging.debug('No text captured, retrying with longer timeout')
+            self._start_capture()
+
+    def _finish_capture(self, selected_text):
+        self._capture_timer.stop()
+        # Only the length is logged: the selection can be huge, and it is the user's text
+        logging.debug('Selected text captured (%d characters)', len(selected_text))
+
+        # Restore the clipboard, unless copying the selection left it as it was
+        if self._selection_backup is not None and self._selection_backup != selected_text:
+            self.clipboard.setText(self._selection_backup)
+        self._selection_backup = None
+
+        self.selection_ready.emit(selected_text)
+
+    def request_paste(self, text):
+        """
+        Paste the text into the focused app through the clipboard.
+        """
+        # A restore still pending from the last paste means the clipboard holds our text, not the user's
+        if not self._restore_timer.isActive():
+            self._clipboard_backup = self._text_backup()
+        self.clipboard.setText(text)
+        self._pasted_text = text
+
+        self._press_ctrl('v')
+        if self._clipboard_backup is None or self._clipboard_backup == text:
+            # Nothing to put back: the clipboard held no text, or already held this text
+            self._restore_timer.stop()
+            self._clipboard_backup = None
+            self._pasted_text = None
+        else:
+            # Give the target app time to read the clipboard before restoring it
+            self._restore_timer.start()
+
+    def type_text(self, text):
+        """
+        Type the text into the focused app as key presses, leaving the clipboard alone.
+        """
+        self.keyboard.type(text)
+
+    @Slot()
+    def _restore_clipboard(self):
+        """
+        Put back the clipboard contents from before the last paste, unless something else was copied since.
+        """
+        if self.clipboard.text() == self._pasted_text:
+            self.clipboard.setText(self._clipboard_backup)
+        self._clipboard_backup = None
+        self._pasted_text = None
@@ -3,8 +3,9 @@ import sys
 
 from WritingToolApp import WritingToolApp
 
-# Set up logging to console
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Set up logging to console; packaged builds only log warnings and errors
+logging.basicConfig(level=logging.WARNING if getattr(sys, 'frozen', False) else logging.DEBUG,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
 
 
 def main():
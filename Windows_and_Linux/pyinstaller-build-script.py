@@ -12,9 +12,15 @@ def run_pyinstaller_build():
         "--name=Writing Tools",
         "--clean",
         "--noconfirm",
+        # Strip asserts from the bundled bytecode (docstrings stay, some dependencies read them)
+        "--optimize", "1",
+        # UPX-packed DLLs have to be unpacked on every start of the onefile build
+        "--noupx",
         # Exclude unnecessary modules
         "--exclude-module", "tkinter",
         "--exclude-module", "unittest",
+        "--exclude-module", "pydoc",
+        "--exclude-module", "test",
         "--exclude-module", "IPython",
         "--exclude-module", "jedi",
         "--exclude-module", "email_validator",
@@ -0,0 +1,52 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("pynput")
+pytest.importorskip("darkdetect")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from WritingToolApp import WritingToolApp  # noqa: E402
+
+
+class _Provider:
+    """Answers every prompt, except the table one, which fails"""
+    provider_name = "Test"
+
+    async def get_response_async(self, system_instruction, prompt):
+        if prompt.startswith('Convert this into a table'):
+            raise RuntimeError('quota exceeded')
+        return f"response to {prompt!r}"
+
+
+def _app():
+    # Just what the batch methods use of WritingToolApp
+    return SimpleNamespace(
+        current_provider=_Provider(),
+        response_cache_key=lambda system_instruction, prompt: (system_instruction, prompt),
+        get_cached_response=lambda key: None,
+        cache_response=lambda key, response: None,
+    )
+
+
+def test_failing_option_does_not_fail_the_batch():
+    results = asyncio.run(WritingToolApp.process_options_batch_async(_app(), ['Proofread', 'Table'], 'some text'))
+
+    assert results[0] == "response to 'Proofread this:\\n\\nsome text'"
+    assert isinstance(results[1], RuntimeError)
+
+
+@pytest.mark.parametrize('options, selected_text', [
+    (['Proofread', 'Custom'], 'some text'),
+    (['Proofread', 'Unknown'], 'some text'),
+    (['Proofread'], '   '),
+])
+def test_unsupported_batches_are_rejected(options, selected_text):
+    with pytest.raises(ValueError):
+        WritingToolApp.process_options_batch(_app(), options, selected_text)
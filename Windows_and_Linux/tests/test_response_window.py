@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+pytest.importorskip("markdown2")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.ResponseWindow import MarkdownTextBrowser, ResponseWindow  # noqa: E402
+
+
+class _App(QtCore.QObject):
+    """The bits of WritingToolApp a response window talks to"""
+    followup_response_signal = QtCore.Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.config = {}
+
+
+@pytest.fixture
+def window():
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    response_window = ResponseWindow(_App(), "Proofread Result")
+    yield response_window
+    response_window.deleteLater()
+    qt_app.processEvents()
+
+
+def _messages(response_window):
+    return response_window.chat_area.findChildren(MarkdownTextBrowser)
+
+
+def _wait(ms):
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_set_text_right_after_append_text_renders_once(window):
+    before = len(_messages(window))
+
+    window.append_text("Hello")
+    window.set_text("Hello world")
+    # Past the 100 ms coalescing interval, so a leftover flush would have fired
+    _wait(250)
+
+    assert len(_messages(window)) == before + 1
+    assert window._chunks == []
+    assert not window._is_streaming
+    assert not window._stream_timer.isActive()
+
+
+def test_queued_stream_then_final_text_renders_once(window):
+    # Same order stream_to_window and process_option_async queue the calls in
+    before = len(_messages(window))
+    chunks = ["Hello", " ", "world", "\n"]
+    for chunk in chunks:
+        QtCore.QMetaObject.invokeMethod(
+            window, 'append_text', QtCore.Qt.ConnectionType.QueuedConnection, QtCore.Q_ARG(str, chunk)
+        )
+    QtCore.QMetaObject.invokeMethod(
+        window, 'set_text', QtCore.Qt.ConnectionType.QueuedConnection,
+        QtCore.Q_ARG(str, "".join(chunks).rstrip('\n'))
+    )
+    _wait(250)
+
+    assert len(_messages(window)) == before + 1
+    assert window._streaming_display is None
+    assert not window._stream_timer.isActive()
@@ -2,7 +2,47 @@ import webbrowser
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from ui.UIUtils import UIUtils, colorMode
+from ui.UIUtils import FORM_STYLE, UIUtils
+
+# Static about text; the label lays it out once and keeps the links clickable
+_ABOUT_HTML = """
+<p style='text-align: center;'>
+Writing Tools is a free & lightweight tool that helps you improve your writing with AI, similar to Apple's new Apple Intelligence feature. It works with an extensive range of AI LLMs, both online and locally run.<br>
+</p>
+<p style='text-align: center;'>
+<b>Created with care by Jesai, a high school student.</b><br><br>
+Feel free to check out my other AI app, <a href="https://play.google.com/store/apps/details?id=com.jesai.blissai"><b>Bliss AI</b></a>. It's a novel AI tutor that's free on the Google Play Store :)<br><br>
+<b>Contact me:</b> jesaitarun@gmail.com<br><br>
+</p>
+<p style='text-align: center;'>
+<b>⭐ Writing Tools would not be where it is today without its <u>amazing</u> contributors:</b><br>
+<b>1. <a href="https://github.com/CameronRedmore">Cameron Redmore (CameronRedmore)</a>:</b><br>
+Extensively refactored Writing Tools and added OpenAI Compatible API support, streamed responses, and the text generation mode when no text is selected.<br>
+<b>2. <a href="https://github.com/momokrono">momokrono</a>:</b><br>
+Added Linux support, and switched to the pynput API to improve Windows stability. Fixed misc. bugs, such as handling quitting onboarding without completing it.<br>
+<b>3. <a href="https://github.com/Disneyhockey40">Disneyhockey40 (Soszust40)</a>:</b><br>
+Helped add dark mode, the plain theme, tray menu fixes, and UI improvements.</b><br>
+<b>4. <a href="https://github.com/arsaboo">Alok Saboo (arsaboo)</a>:</b><br>
+Helped improve the reliability of text selection.</b><br>
+<b>5. <a href="https://github.com/raghavdhingra24">raghavdhingra24</a>:</b><br>
+Made the rounded corners anti-aliased & prettier.</b><br>
+<b>6. <a href="https://github.com/ErrorCatDev">ErrorCatDev</a>:</b><br>
+Significantly improved the About window, making it scrollable and cleaning things up. Also improved our .gitignore & requirements.txt.</b><br>
+<b>7. <a href="https://github.com/Vadim-Karpenko">Vadim Karpenko</a>:</b><br>
+Helped add the start-on-boot setting!</b><br>
+</p>
+<p style='text-align: center;'>
+<b>Version:</b> 6.0 (Codename: Radically Refined)
+</p>
+<p />
+"""
+
+# The shared form stylesheet, plus a see-through scroll area for the about text
+_ABOUT_STYLE = FORM_STYLE + """
+    QScrollArea#about_scroll, QScrollArea#about_scroll QWidget {
+        background: transparent;
+    }
+"""
 
 
 class AboutWindow(QtWidgets.QWidget):
@@ -27,6 +67,7 @@ class AboutWindow(QtWidgets.QWidget):
         self.move(x, y)
 
         UIUtils.setup_window_and_layout(self)
+        self.setStyleSheet(_ABOUT_STYLE)
 
         # Disable minimize button and icon in title bar
         self.setWindowFlags(self.windowFlags() & ~QtCore.Qt.WindowMinimizeButtonHint & ~QtCore.Qt.WindowSystemMenuHint | QtCore.Qt.WindowCloseButtonHint | QtCore.Qt.WindowTitleHint)
@@ -41,43 +82,14 @@ class AboutWindow(QtWidgets.QWidget):
         content_layout.setSpacing(20)
 
         title_label = QtWidgets.QLabel("About Writing Tools")
-        title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        title_label.setObjectName("title")
         content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
-        about_text = """
-                <p style='text-align: center;'>
-                Writing Tools is a free & lightweight tool that helps you improve your writing with AI, similar to Apple's new Apple Intelligence feature. It works with an extensive range of AI LLMs, both online and locally run.<br>
-                </p>
-                <p style='text-align: center;'>
-                <b>Created with care by Jesai, a high school student.</b><br><br>
-                Feel free to check out my other AI app, <a href="https://play.google.com/store/apps/details?id=com.jesai.blissai"><b>Bliss AI</b></a>. It's a novel AI tutor that's free on the Google Play Store :)<br><br>
-                <b>Contact me:</b> jesaitarun@gmail.com<br><br>
-                </p>
-                <p style='text-align: center;'>
-                <b>⭐ Writing Tools would not be where it is today without its <u>amazing</u> contributors:</b><br>
-                <b>1. <a href="https://github.com/CameronRedmore">Cameron Redmore (CameronRedmore)</a>:</b><br>
-                Extensively refactored Writing Tools and added OpenAI Compatible API support, streamed responses, and the text generation mode when no text is selected.<br>
-                <b>2. <a href="https://github.com/momokrono">momokrono</a>:</b><br>
-                Added Linux support, and switched to the pynput API to improve Windows stability. Fixed misc. bugs, such as handling quitting onboarding without completing it.<br>
-                <b>3. <a href="https://github.com/Disneyhockey40">Disneyhockey40 (Soszust40)</a>:</b><br>
-                Helped add dark mode, the plain theme, tray menu fixes, and UI improvements.</b><br>
-                <b>4. <a href="https://github.com/arsaboo">Alok Saboo (arsaboo)</a>:</b><br>
-                Helped improve the reliability of text selection.</b><br>
-                <b>5. <a href="https://github.com/raghavdhingra24">raghavdhingra24</a>:</b><br>
-                Made the rounded corners anti-aliased & prettier.</b><br>
-                <b>6. <a href="https://github.com/ErrorCatDev">ErrorCatDev</a>:</b><br>
-                Significantly improved the About window, making it scrollable and cleaning things up. Also improved our .gitignore & requirements.txt.</b><br>
-                <b>7. <a href="https://github.com/Vadim-Karpenko">Vadim Karpenko</a>:</b><br>
-                Helped add the start-on-boot setting!</b><br>
-                </p>
-                <p style='text-align: center;'>
-                <b>Version:</b> 6.0 (Codename: Radically Refined)
-                </p>
-                <p />
-                """
-
-        about_label = QtWidgets.QLabel(about_text)
-        about_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        about_label = QtWidgets.QLabel()
+        # Declared rich text before the text is set, so Qt parses it once and never sniffs it
+        about_label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        about_label.setText(_ABOUT_HTML)
+        about_label.setObjectName("setting_label")
         about_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         about_label.setWordWrap(True)
         about_label.setOpenExternalLinks(True)  # Allow opening hyperlinks
@@ -85,27 +97,12 @@ class AboutWindow(QtWidgets.QWidget):
         scroll_area = QtWidgets.QScrollArea()
         scroll_area.setWidget(about_label)
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("background: transparent;")
+        scroll_area.setObjectName("about_scroll")
 
         content_layout.addWidget(scroll_area)
 
         # Add "Check for updates" button
-        update_button = QtWidgets.QPushButton('Check for updates')
-        update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                font-size: 16px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        update_button.clicked.connect(self.check_for_updates)
-        content_layout.addWidget(update_button)
+        content_layout.addWidget(UIUtils.make_button('Check for updates', "primary_button", self.check_for_updates))
 
     def check_for_updates(self):
         """
@@ -3,7 +3,7 @@ import logging
 from PySide6 import QtCore, QtWidgets
 from PySide6.QtWidgets import QHBoxLayout, QRadioButton
 
-from ui.UIUtils import UIUtils, colorMode
+from ui.UIUtils import FORM_STYLE, UIUtils
 
 
 class OnboardingWindow(QtWidgets.QWidget):
@@ -24,6 +24,8 @@ class OnboardingWindow(QtWidgets.QWidget):
         self.resize(600, 500)
 
         UIUtils.setup_window_and_layout(self)
+        # Every screen's widgets are styled by object name from this one stylesheet
+        self.setStyleSheet(FORM_STYLE)
 
         self.content_layout = QtWidgets.QVBoxLayout()
         self.content_layout.setContentsMargins(30, 30, 30, 30)
@@ -37,7 +39,7 @@ class OnboardingWindow(QtWidgets.QWidget):
         UIUtils.clear_layout(self.content_layout)
 
         title_label = QtWidgets.QLabel("Welcome to Writing Tools!")
-        title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        title_label.setObjectName("title")
         self.content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
         features_text = """
@@ -53,54 +55,34 @@ class OnboardingWindow(QtWidgets.QWidget):
             - ANY OpenAI Compatible API — including local LLMs!
         """
         features_label = QtWidgets.QLabel(features_text)
-        features_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        features_label.setObjectName("setting_label")
         features_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
         self.content_layout.addWidget(features_label)
 
         shortcut_label = QtWidgets.QLabel("Customize your shortcut key (default: \"ctrl+space\"):")
-        shortcut_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        shortcut_label.setObjectName("setting_label")
         self.content_layout.addWidget(shortcut_label)
 
         self.shortcut_input = QtWidgets.QLineEdit(self.shortcut)
-        self.shortcut_input.setStyleSheet(f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-        """)
+        self.shortcut_input.setObjectName("setting_input")
         self.content_layout.addWidget(self.shortcut_input)
 
         theme_label = QtWidgets.QLabel("Choose your theme:")
-        theme_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        theme_label.setObjectName("setting_label")
         self.content_layout.addWidget(theme_label)
 
         theme_layout = QHBoxLayout()
         gradient_radio = QRadioButton("Gradient")
         plain_radio = QRadioButton("Plain")
-        gradient_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
-        plain_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        gradient_radio.setObjectName("setting_radio")
+        plain_radio.setObjectName("setting_radio")
         gradient_radio.setChecked(self.theme == 'gradient')
         plain_radio.setChecked(self.theme == 'plain')
         theme_layout.addWidget(gradient_radio)
         theme_layout.addWidget(plain_radio)
         self.content_layout.addLayout(theme_layout)
 
-        next_button = QtWidgets.QPushButton('Next')
-        next_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                font-size: 16px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        next_button.clicked.connect(lambda: self.on_next_clicked(gradient_radio.isChecked()))
+        next_button = UIUtils.make_button('Next', "primary_button", lambda: self.on_next_clicked(gradient_radio.isChecked()))
         self.content_layout.addWidget(next_button)
 
     def on_next_clicked(self, is_gradient):
@@ -1,13 +1,202 @@
+import functools
 import logging
-import os
-import sys
+import threading
+from collections import namedtuple
 
-import markdown2
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtWidgets
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import QScrollArea
 
-from ui.UIUtils import UIUtils, colorMode
+from ui.UIUtils import UIUtils, colorMode, icon
+
+# A single chat history entry; role is "user" or "assistant"
+ChatMsg = namedtuple('ChatMsg', 'role content')
+
+# Constant UI strings, built once instead of on every window open / animation tick
+_THINKING = "Thinking"
+_THINKING_FRAMES = tuple(_THINKING + dots for dots in ("", ".", "..", "..."))
+_ASK_PLACEHOLDER = "Ask a follow-up question..."
+_COPY_HINT = "Select to copy with formatting"
+
+# Message font size is base size * zoom factor; zoom is shared by every message in a window
+_BASE_FONT_SIZE = 14
+_DEFAULT_ZOOM = 1.2
+_MIN_ZOOM = 0.5
+_MAX_ZOOM = 3.0
+
+# Stylesheets only depend on the colour mode, so build them once
+_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: {'#444' if colorMode == 'dark' else '#f0f0f0'};
+        color: {'#ffffff' if colorMode == 'dark' else '#000000'};
+        border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }}
+    QPushButton:hover {{
+        background-color: {'#555' if colorMode == 'dark' else '#e0e0e0'};
+    }}
+"""
+
+# Message bubble styles, keyed by whether the message is the user's
+_MESSAGE_STYLES = {
+    True: f"""
+    QTextBrowser {{
+        background-color: transparent;
+        color: {'#ffffff' if colorMode == 'dark' else '#000000'};
+        border: none;
+        border-radius: 8px;
+        padding: 8px;
+        margin: 0px;
+        line-height: 1.3;
+        width: 100%;
+    }}
+""",
+    False: f"""
+    QTextBrowser {{
+        background-color: {'#333' if colorMode == 'dark' else 'white'};
+        color: {'#ffffff' if colorMode == 'dark' else '#000000'};
+        border: 1px solid {'#555' if colorMode == 'dark' else '#ccc'};
+        border-radius: 8px;
+        padding: 8px;
+        margin: 0px;
+        line-height: 1.3;
+        width: 100%;
+    }}
+""",
+}
+
+_SCROLL_AREA_STYLE = """
+    QScrollArea {
+        background-color: transparent;
+        border: none;
+    }
+    QScrollArea > QWidget > QWidget {
+        background-color: transparent;
+    }
+    QScrollBar:vertical {
+        background-color: transparent;
+        width: 12px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: rgba(128, 128, 128, 0.5);
+        min-height: 20px;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+_TITLE_STYLE = f"font-size: 20px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};"
+_HINT_STYLE = f"color: {'#aaaaaa' if colorMode == 'dark' else '#666666'}; font-size: 14px;"
+_ZOOM_LABEL_STYLE = f"""
+    color: {'#aaaaaa' if colorMode == 'dark' else '#666666'};
+    font-size: 14px;
+    margin-right: 5px;
+"""
+
+_LOADING_STYLE = f"""
+    QLabel {{
+        color: {'#ffffff' if colorMode == 'dark' else '#333333'};
+        font-size: 18px;
+        padding: 20px;
+    }}
+"""
+
+_INPUT_STYLE = f"""
+    QLineEdit {{
+        padding: 8px;
+        border: 1px solid {'#777' if colorMode == 'dark' else '#ccc'};
+        border-radius: 8px;
+        background-color: {'#333' if colorMode == 'dark' else 'white'};
+        color: {'#ffffff' if colorMode == 'dark' else '#000000'};
+        font-size: 14px;
+    }}
+"""
+
+_SEND_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: {'#2e7d32' if colorMode == 'dark' else '#4CAF50'};
+        border: none;
+        border-radius: 8px;
+        padding: 5px;
+    }}
+    QPushButton:hover {{
+        background-color: {'#1b5e20' if colorMode == 'dark' else '#45a049'};
+    }}
+"""
+
+# Rich-text CSS for rendered messages, set once per document via setDefaultStyleSheet
+_DOCUMENT_CSS = f"""
+    table {{
+        border-collapse: collapse;
+        width: 100%;
+        margin: 10px 0;
+    }}
+    th, td {{
+        border: 1px solid {'#555' if colorMode == 'dark' else '#ccc'};
+        padding: 8px;
+        text-align: left;
+    }}
+    th {{
+        background-color: {'#444' if colorMode == 'dark' else '#f5f5f5'};
+        font-weight: bold;
+    }}
+"""
+
+# One converter reused for every message (convert() resets its own per-document state).
+# markdown2 is only imported when the first message is rendered.
+_MD_EXTRAS = ['tables', 'fenced-code-blocks', 'cuddled-lists']
+_MD = None
+
+
+def _new_converter():
+    import markdown2
+    return markdown2.Markdown(extras=_MD_EXTRAS)
+
+
+def _convert_markdown(text):
+    """Convert Markdown to HTML on the GUI thread, without caching (for text that won't be rendered again)"""
+    global _MD
+    if _MD is None:
+        _MD = _new_converter()
+    return _MD.convert(text)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_markdown(text):
+    """Convert Markdown to HTML, memoized so re-rendering the same text is free"""
+    return _convert_markdown(text)
+
+
+class _RenderSignals(QtCore.QObject):
+    done = QtCore.Signal(int, str)  # generation, html
+
+
+class MarkdownRenderer(QtCore.QRunnable):
+    """Convert streamed Markdown to HTML on a pool thread and post the result back"""
+    # Markdown.convert() keeps per-document state, so each pool thread gets its own converter
+    _local = threading.local()
+
+    def __init__(self, generation, text):
+        super().__init__()
+        self.generation = generation
+        self.text = text
+        self.signals = _RenderSignals()
+
+    def run(self):
+        md = getattr(self._local, 'md', None)
+        if md is None:
+            md = self._local.md = _new_converter()
+        self.signals.done.emit(self.generation, md.convert(self.text))
+
+
+# Zoom buttons are 30x30 with 8px padding, so their icons are drawn at 16x16
+_ZOOM_ICON_SIZE = 16
 
 
 class MarkdownTextBrowser(QtWidgets.QTextBrowser):
@@ -17,9 +206,15 @@ class MarkdownTextBrowser(QtWidgets.QTextBrowser):
         super().__init__(parent)
         self.setReadOnly(True)
         self.setOpenExternalLinks(True)
-        self.zoom_factor = 1.2
-        self.base_font_size = 14
         self.is_user_message = is_user_message
+        # Set by ChatContentScrollArea.add_message so events don't walk the parent chain
+        self._response_window = None
+        self._scroll_area = None
+        # Ctrl+wheel delta accumulated until the debounce timer fires
+        self._pending_zoom_delta = 0
+        self._zoom_pending = False
+        # Width last applied by ChatContentScrollArea, so unchanged messages can be skipped
+        self._laid_out_width = None
         
         # Critical: Remove scrollbars to prevent extra space
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -31,53 +226,15 @@ class MarkdownTextBrowser(QtWidgets.QTextBrowser):
             QtWidgets.QSizePolicy.Policy.Minimum
         )
         
-        self._apply_zoom()
+        self._apply_style()
         
-    def _apply_zoom(self):
-        new_size = int(self.base_font_size * self.zoom_factor)
-        
-        # Updated stylesheet with table styling
-        self.setStyleSheet(f"""
-            QTextBrowser {{
-                background-color: {('transparent' if self.is_user_message else '#333' if colorMode == 'dark' else 'white')};
-                color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-                border: {('none' if self.is_user_message else '1px solid ' + ('#555' if colorMode == 'dark' else '#ccc'))};
-                border-radius: 8px;
-                padding: 8px;
-                margin: 0px;
-                font-size: {new_size}px;
-                line-height: 1.3;
-                width: 100%;
-            }}
-
-            /* Table styles */
-            table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 10px 0;
-            }}
-            
-            th, td {{
-                border: 1px solid {'#555' if colorMode == 'dark' else '#ccc'};
-                padding: 8px;
-                text-align: left;
-            }}
-            
-            th {{
-                background-color: {'#444' if colorMode == 'dark' else '#f5f5f5'};
-                font-weight: bold;
-            }}
-            
-            tr:nth-child(even) {{
-                background-color: {'#3a3a3a' if colorMode == 'dark' else '#f9f9f9'};
-            }}
-            
-            tr:hover {{
-                background-color: {'#484848' if colorMode == 'dark' else '#f0f0f0'};
-            }}
-        """)
+    def _apply_style(self):
+        # Font size is not set here: it is inherited from the chat area's content widget font
+        # Table styling lives in the document's default stylesheet, not in this widget stylesheet
+        self.document().setDefaultStyleSheet(_DOCUMENT_CSS)
+        self.setStyleSheet(_MESSAGE_STYLES[self.is_user_message])
         
-    def _update_size(self):
+    def _update_size(self, notify_scroll_area=True):
         # Calculate correct document width
         available_width = self.viewport().width() - 16  # Account for padding
         self.document().setTextWidth(available_width)
@@ -95,57 +252,38 @@ class MarkdownTextBrowser(QtWidgets.QTextBrowser):
             
             # Update scroll area if needed
             scroll_area = self.get_scroll_area()
-            if scroll_area:
+            if scroll_area and notify_scroll_area:
                 scroll_area.update_content_height()
                 
     def wheelEvent(self, event):
         if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            delta = event.angleDelta().y()
-            # Get the main response window
-            parent = self.parent()
-            while parent and not isinstance(parent, ResponseWindow):
-                parent = parent.parent()
-                
-            if parent:
-                if delta > 0:
-                    parent.zoom_all_messages('in')
-                else:
-                    parent.zoom_all_messages('out')
+            if self._response_window:
+                # Coalesce a burst of wheel ticks into a single zoom pass
+                self._pending_zoom_delta += event.angleDelta().y()
+                if not self._zoom_pending:
+                    self._zoom_pending = True
+                    QtCore.QTimer.singleShot(30, self._apply_pending_zoom)
                 event.accept()
         else:
             # Pass wheel events to parent for scrolling
             if self.parent():
                 self.parent().wheelEvent(event)
             
-    def zoom_in(self):
-        old_factor = self.zoom_factor
-        self.zoom_factor = min(3.0, self.zoom_factor * 1.1)
-        if old_factor != self.zoom_factor:
-            self._apply_zoom()
-            self._update_size()
-        
-    def zoom_out(self):
-        old_factor = self.zoom_factor
-        self.zoom_factor = max(0.5, self.zoom_factor / 1.1)
-        if old_factor != self.zoom_factor:
-            self._apply_zoom()
-            self._update_size()
-        
-    def reset_zoom(self):
-        old_factor = self.zoom_factor
-        self.zoom_factor = 1.2  # Reset to default zoom
-        if old_factor != self.zoom_factor:
-            self._apply_zoom()
-            self._update_size()
+    def _apply_pending_zoom(self):
+        """Apply the wheel delta accumulated since the first tick of the gesture"""
+        delta = self._pending_zoom_delta
+        self._pending_zoom_delta = 0
+        self._zoom_pending = False
+        if not delta or not self._response_window:
+            return
+            
+        # One 1.1x step per standard 120-unit notch, and at least one for any movement
+        steps = max(1, round(abs(delta) / 120))
+        self._response_window.zoom_all_messages('in' if delta > 0 else 'out', steps)
     
     def get_scroll_area(self):
-        """Find the parent ChatContentScrollArea"""
-        parent = self.parent()
-        while parent:
-            if isinstance(parent, ChatContentScrollArea):
-                return parent
-            parent = parent.parent()
-        return None
+        """Return the ChatContentScrollArea this message was added to"""
+        return self._scroll_area
         
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -155,8 +293,9 @@ class MarkdownTextBrowser(QtWidgets.QTextBrowser):
 class ChatContentScrollArea(QScrollArea):
     """Improved scrollable container for chat messages with dynamic sizing and proper spacing"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, response_window=None):
         super().__init__(parent)
+        self.response_window = response_window
         self.setup_ui()
         
     def setup_ui(self):
@@ -178,32 +317,31 @@ class ChatContentScrollArea(QScrollArea):
         self.layout.setContentsMargins(15, 15, 15, 15)  # Adjusted margins
         self.layout.addStretch()
         
+        # Resizes and zoom changes only mark state dirty; the timer relayouts at most once per frame
+        self._dirty_width = False
+        self._dirty_zoom = False
+        self._layout_timer = QtCore.QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(16)
+        self._layout_timer.timeout.connect(self._flush_updates)
+        # Zoom requests made within one event-loop turn are applied as a single font change
+        self._zoom_timer = QtCore.QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(0)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+        
+        # Trimmed messages are rebuilt when they scroll back into view
+        self._placeholders = []  # Stand-ins for trimmed messages, oldest first
+        self.verticalScrollBar().valueChanged.connect(self._restore_visible_messages)
+        
+        # Every message inherits its font size from the content widget's font
+        self.zoom_factor = None
+        self.set_zoom_factor(_DEFAULT_ZOOM)
+        
         # Enhanced scroll area styling
-        self.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: transparent;
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(128, 128, 128, 0.5);
-                min-height: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-
-    def add_message(self, text, is_user=False):
+        self.setStyleSheet(_SCROLL_AREA_STYLE)
+
+    def add_message(self, text, is_user=False, html=None):
         # Remove bottom stretch
         self.layout.takeAt(self.layout.count() - 1)
         
@@ -219,35 +357,111 @@ class ChatContentScrollArea(QScrollArea):
         msg_layout.setContentsMargins(0, 0, 0, 0)
         msg_layout.setSpacing(0)
         
-        # Create text display with updated width
-        text_display = MarkdownTextBrowser(is_user_message=is_user)
-        
-        # Enable tables extension in markdown2
-        html = markdown2.markdown(text, extras=['tables'])
-        text_display.setHtml(html)
-        
-        # Calculate proper text display size using full width
-        text_display.document().setTextWidth(self.width() - 20)
-        doc_size = text_display.document().size()
-        text_display.setMinimumHeight(int(doc_size.height() + 16))
+        if html is None:
+            html = _render_markdown(text)
+        text_display = self._create_text_display(html, is_user)
         
         msg_layout.addWidget(text_display)
         
         self.layout.addWidget(msg_container)
         self.layout.addStretch()
         
-        if hasattr(self.parent(), 'current_text_display'):
-            self.parent().current_text_display = text_display
+        if self.response_window is not None:
+            self.response_window.current_text_display = text_display
             
         QtCore.QTimer.singleShot(50, self.post_message_updates)
         
         return text_display
 
+    def _create_text_display(self, html, is_user):
+        """Create a message browser for already-rendered HTML, sized to the current width"""
+        text_display = MarkdownTextBrowser(is_user_message=is_user)
+        text_display._response_window = self.response_window
+        text_display._scroll_area = self
+        text_display._html = html  # Kept so the message can be rebuilt after trimming
+        text_display.setHtml(html)
+        
+        # Calculate proper text display size using full width
+        text_display.document().setTextWidth(self.width() - 20)
+        doc_size = text_display.document().size()
+        text_display.setMinimumHeight(int(doc_size.height() + 16))
+        
+        return text_display
+
+    def update_message(self, text_display, text):
+        """Re-render an existing message in place with its final text"""
+        self.set_message_html(text_display, _render_markdown(text))
+
+    def set_message_html(self, text_display, html, final=True):
+        """Replace a message's HTML, e.g. with a partial render while a response is streaming in"""
+        text_display._html = html
+        text_display.setHtml(html)
+        # Partial renders only resize the message itself; the content and window
+        # height are recalculated once the final text arrives
+        text_display._update_size(notify_scroll_area=final)
+        self.scroll_to_bottom()
+
     def post_message_updates(self):
         """Handle updates after adding a message with proper timing"""
         self.scroll_to_bottom()
-        if isinstance(self.parent(), ResponseWindow):
-            self.parent()._adjust_window_height()
+        self._trim_history()
+        if self.response_window is not None and not self.response_window._is_streaming:
+            self.response_window._adjust_window_height()
+
+    def _is_in_view(self, container):
+        """Check whether a message container overlaps the visible part of the chat"""
+        top = self.verticalScrollBar().value()
+        bottom = top + self.viewport().height()
+        return container.y() < bottom and container.y() + container.height() > top
+
+    def _trim_history(self, max_live=20):
+        """
+        Keep at most max_live parsed messages alive by swapping the oldest off-screen ones
+        for fixed-height placeholders that remember their HTML.
+        """
+        displays = list(self.message_displays())
+        excess = len(displays) - max_live
+        for text_display in displays:
+            if excess <= 0:
+                break
+            container = text_display.parentWidget()
+            if self._is_in_view(container):
+                continue
+                
+            placeholder = QtWidgets.QWidget()
+            placeholder.setFixedHeight(text_display.height())
+            placeholder.setProperty("cached_html", text_display._html)
+            placeholder.setProperty("is_user_message", text_display.is_user_message)
+            # The height and zoom it was measured at, so a later zoom can scale it
+            placeholder.setProperty("trimmed_height", text_display.height())
+            placeholder.setProperty("trimmed_zoom", self.zoom_factor)
+            container.layout().replaceWidget(text_display, placeholder)
+            text_display.setParent(None)
+            text_display.deleteLater()
+            self._placeholders.append(placeholder)
+            excess -= 1
+
+    def _restore_visible_messages(self):
+        """Rebuild trimmed messages that have scrolled into view"""
+        # Only placeholders are checked, so scrolling a chat with nothing trimmed costs nothing
+        restored = False
+        for placeholder in list(self._placeholders):
+            container = placeholder.parentWidget()
+            if not self._is_in_view(container):
+                continue
+                
+            text_display = self._create_text_display(
+                placeholder.property("cached_html"),
+                placeholder.property("is_user_message")
+            )
+            container.layout().replaceWidget(placeholder, text_display)
+            placeholder.setParent(None)
+            placeholder.deleteLater()
+            self._placeholders.remove(placeholder)
+            restored = True
+            
+        if restored:
+            self._trim_history()
 
     def update_content_height(self):
         """Recalculate total content height with improved spacing calculation"""
@@ -268,30 +482,88 @@ class ChatContentScrollArea(QScrollArea):
         self.content_widget.setMinimumHeight(total_height + 10)
         
         # Update window height if needed
-        if isinstance(self.parent(), ResponseWindow):
-            self.parent()._adjust_window_height()
+        if self.response_window is not None:
+            self.response_window._adjust_window_height()
 
     def scroll_to_bottom(self):
         """Smooth scroll to bottom of content"""
         vsb = self.verticalScrollBar()
         vsb.setValue(vsb.maximum())
 
-    def resizeEvent(self, event):
-        """Handle resize events with improved width calculations"""
-        super().resizeEvent(event)
-        
-        # Update width for all message displays
-        available_width = self.width() - 40  # Account for margins
+    def message_displays(self):
+        """Yield the MarkdownTextBrowser of every message, oldest first"""
         for i in range(self.layout.count() - 1):  # Skip stretch item
             item = self.layout.itemAt(i)
             if item and item.widget():
-                container = item.widget()
-                text_display = container.layout().itemAt(0).widget()
+                text_display = item.widget().layout().itemAt(0).widget()
                 if isinstance(text_display, MarkdownTextBrowser):
-                    # Recalculate text width and height
-                    text_display.document().setTextWidth(available_width)
-                    doc_size = text_display.document().size()
-                    text_display.setMinimumHeight(int(doc_size.height() + 20))  # Reduced padding
+                    yield text_display
+
+    def set_zoom_factor(self, factor):
+        """
+        Set the zoom factor for every message at once.
+        The font size is set on the content widget and propagates to all message browsers
+        without a stylesheet reparse. With messages shown, the font change is deferred to the
+        next event-loop turn so bursts of zoom steps apply once.
+        """
+        factor = max(_MIN_ZOOM, min(_MAX_ZOOM, factor))
+        if factor == self.zoom_factor:
+            return
+        self.zoom_factor = factor
+        
+        if next(self.message_displays(), None) is None and not self._placeholders:
+            # Nothing to re-measure yet, so apply right away
+            self._apply_zoom_font()
+            return
+        self._zoom_timer.start()
+
+    def _apply_zoom_font(self):
+        font = self.content_widget.font()
+        font.setPixelSize(int(_BASE_FONT_SIZE * self.zoom_factor))
+        self.content_widget.setFont(font)
+
+    def _apply_zoom(self):
+        """Apply the latest zoom factor and schedule one re-measure of every message"""
+        self._apply_zoom_font()
+        self._dirty_zoom = True
+        if not self._layout_timer.isActive():
+            self._layout_timer.start()
+
+    def resizeEvent(self, event):
+        """Handle resize events by scheduling a coalesced relayout"""
+        super().resizeEvent(event)
+        self._dirty_width = True
+        if not self._layout_timer.isActive():
+            self._layout_timer.start()
+
+    def _flush_updates(self):
+        """Re-measure every message whose width or zoom changed since the last flush"""
+        if self._dirty_zoom:
+            # The font changed for everyone, so every message needs a new height
+            self._dirty_zoom = False
+            for text_display in self.message_displays():
+                text_display._update_size(notify_scroll_area=False)
+            # Trimmed messages aren't parsed, so their stand-ins are scaled with the zoom instead
+            for placeholder in self._placeholders:
+                placeholder.setFixedHeight(int(placeholder.property("trimmed_height")
+                                               * self.zoom_factor / placeholder.property("trimmed_zoom")))
+            self.update_content_height()
+            
+        if not self._dirty_width:
+            return
+        self._dirty_width = False
+        
+        available_width = self.width() - 40  # Account for margins
+        for text_display in self.message_displays():
+            if text_display._laid_out_width == available_width:
+                continue
+            text_display._laid_out_width = available_width
+            
+            # Recalculate text width and height
+            doc = text_display.document()
+            doc.setTextWidth(available_width)
+            content_height = doc.documentLayout().documentSize().height()
+            text_display.setMinimumHeight(int(content_height + 20))  # Reduced padding
 
 
 class ResponseWindow(QtWidgets.QWidget):
@@ -310,9 +582,23 @@ class ResponseWindow(QtWidgets.QWidget):
         self.thinking_timer = QtCore.QTimer(self)
         self.thinking_timer.timeout.connect(self.update_thinking_dots)
         self.thinking_dots_state = 0
-        self.thinking_dots = ["", ".", "..", "..."]  # Now properly includes all states
+        self._thinking_target = None  # Setter the animation writes frames to
+        self._loading_shown = False  # Tracked so the loading row is only shown/hidden on a real change
         self.thinking_timer.setInterval(300)
 
+        # Streamed chunks are buffered and rendered in bursts rather than per token
+        self._chunks = []  # Joined only when a render actually happens
+        self._last_text_hash = None  # Hash of the text last passed to set_text
+        self._streaming_display = None
+        self._is_streaming = False
+        # Renders are numbered so a worker result older than the one on screen is dropped
+        self._render_generation = 0
+        self._shown_generation = 0
+        self._stream_timer = QtCore.QTimer(self)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.setInterval(100)
+        self._stream_timer.timeout.connect(self._flush_stream)
+
         self.init_ui()
         logging.debug('Connecting response signals')
         self.app.followup_response_signal.connect(self.handle_followup_response)
@@ -341,18 +627,14 @@ class ResponseWindow(QtWidgets.QWidget):
         top_bar = QtWidgets.QHBoxLayout()
         
         title_label = QtWidgets.QLabel(self.option)
-        title_label.setStyleSheet(f"font-size: 20px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        title_label.setStyleSheet(_TITLE_STYLE)
         top_bar.addWidget(title_label)
         
         top_bar.addStretch()
 
         # Zoom label with matched size
         zoom_label = QtWidgets.QLabel("Zoom:")
-        zoom_label.setStyleSheet(f"""
-            color: {'#aaaaaa' if colorMode == 'dark' else '#666666'};
-            font-size: 14px;
-            margin-right: 5px;
-        """)
+        zoom_label.setStyleSheet(_ZOOM_LABEL_STYLE)
         top_bar.addWidget(zoom_label)
         
         # Enhanced zoom controls with swapped order
@@ -362,10 +644,11 @@ class ResponseWindow(QtWidgets.QWidget):
             ('reset', 'Reset Zoom', lambda: self.zoom_all_messages('reset'))
         ]
             
-        for icon, tooltip, action in zoom_controls:
+        for icon_name, tooltip, action in zoom_controls:
             btn = QtWidgets.QPushButton()
-            btn.setIcon(QtGui.QIcon(os.path.join(os.path.dirname(sys.argv[0]), 'icons', icon + ('_dark' if colorMode == 'dark' else '_light') + '.png')))
-            btn.setStyleSheet(self.get_button_style())
+            btn.setIcon(icon(icon_name, _ZOOM_ICON_SIZE))
+            btn.setIconSize(QtCore.QSize(_ZOOM_ICON_SIZE, _ZOOM_ICON_SIZE))
+            btn.setStyleSheet(_BUTTON_STYLE)
             btn.setToolTip(tooltip)
             btn.clicked.connect(action)
             btn.setFixedSize(30, 30)
@@ -375,13 +658,13 @@ class ResponseWindow(QtWidgets.QWidget):
 
         # Copy controls with matching text size
         copy_bar = QtWidgets.QHBoxLayout()
-        copy_hint = QtWidgets.QLabel("Select to copy with formatting")
-        copy_hint.setStyleSheet(f"color: {'#aaaaaa' if colorMode == 'dark' else '#666666'}; font-size: 14px;")
+        copy_hint = QtWidgets.QLabel(_COPY_HINT)
+        copy_hint.setStyleSheet(_HINT_STYLE)
         copy_bar.addWidget(copy_hint)
         copy_bar.addStretch()
         
         copy_md_btn = QtWidgets.QPushButton("Copy as Markdown")
-        copy_md_btn.setStyleSheet(self.get_button_style())
+        copy_md_btn.setStyleSheet(_BUTTON_STYLE)
         copy_md_btn.clicked.connect(self.copy_first_response)  # Updated to only copy first response
         copy_bar.addWidget(copy_md_btn)
         content_layout.addLayout(copy_bar)
@@ -391,14 +674,8 @@ class ResponseWindow(QtWidgets.QWidget):
         loading_layout = QtWidgets.QHBoxLayout(loading_container)
         loading_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.loading_label = QtWidgets.QLabel("Thinking")
-        self.loading_label.setStyleSheet(f"""
-            QLabel {{
-                color: {'#ffffff' if colorMode == 'dark' else '#333333'};
-                font-size: 18px;
-                padding: 20px;
-            }}
-        """)
+        self.loading_label = QtWidgets.QLabel(_THINKING)
+        self.loading_label.setStyleSheet(_LOADING_STYLE)
         self.loading_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
         
         loading_inner_container = QtWidgets.QWidget()
@@ -418,40 +695,21 @@ class ResponseWindow(QtWidgets.QWidget):
         self.start_thinking_animation(initial=True)
         
         # Enhanced chat area with full width
-        self.chat_area = ChatContentScrollArea()
+        self.chat_area = ChatContentScrollArea(response_window=self)
         content_layout.addWidget(self.chat_area)
         
         # Input area with enhanced styling
         bottom_bar = QtWidgets.QHBoxLayout()
         
         self.input_field = QtWidgets.QLineEdit()
-        self.input_field.setPlaceholderText("Ask a follow-up question...")
-        self.input_field.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 8px;
-                border: 1px solid {'#777' if colorMode == 'dark' else '#ccc'};
-                border-radius: 8px;
-                background-color: {'#333' if colorMode == 'dark' else 'white'};
-                color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-                font-size: 14px;
-            }}
-        """)
+        self.input_field.setPlaceholderText(_ASK_PLACEHOLDER)
+        self.input_field.setStyleSheet(_INPUT_STYLE)
         self.input_field.returnPressed.connect(self.send_message)
         bottom_bar.addWidget(self.input_field)
         
         send_button = QtWidgets.QPushButton()
-        send_button.setIcon(QtGui.QIcon(os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'send' + ('_dark' if colorMode == 'dark' else '_light') + '.png')))
-        send_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {'#2e7d32' if colorMode == 'dark' else '#4CAF50'};
-                border: none;
-                border-radius: 8px;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {'#1b5e20' if colorMode == 'dark' else '#45a049'};
-            }}
-        """)
+        send_button.setIcon(icon('send', _ZOOM_ICON_SIZE))
+        send_button.setStyleSheet(_SEND_BUTTON_STYLE)
         send_button.setFixedSize(self.input_field.sizeHint().height(), self.input_field.sizeHint().height())
         send_button.clicked.connect(self.send_message)
         bottom_bar.addWidget(send_button)
@@ -468,8 +726,8 @@ class ResponseWindow(QtWidgets.QWidget):
                 
             # Find first assistant message
             for msg in self.chat_history:
-                if msg["role"] == "assistant":
-                    return msg["content"]
+                if msg.role == "assistant":
+                    return msg.content
                     
             return None
         except Exception as e:
@@ -482,74 +740,57 @@ class ResponseWindow(QtWidgets.QWidget):
         if response_text:
             QtWidgets.QApplication.clipboard().setText(response_text)
 
-    def get_button_style(self):
-        return f"""
-            QPushButton {{
-                background-color: {'#444' if colorMode == 'dark' else '#f0f0f0'};
-                color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-                border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {'#555' if colorMode == 'dark' else '#e0e0e0'};
-            }}
-        """
-
     def update_thinking_dots(self):
         """Update the thinking animation dots with proper cycling"""
-        self.thinking_dots_state = (self.thinking_dots_state + 1) % len(self.thinking_dots)
-        dots = self.thinking_dots[self.thinking_dots_state]
-        
-        if self.loading_label.isVisible():
-            self.loading_label.setText(f"Thinking{dots}")
-        else:
-            self.input_field.setPlaceholderText(f"Thinking{dots}")
+        self.thinking_dots_state = (self.thinking_dots_state + 1) & 3
+        self._thinking_target(_THINKING_FRAMES[self.thinking_dots_state])
     
     def start_thinking_animation(self, initial=False):
         """Start the thinking animation for either initial load or follow-up questions"""
         self.thinking_dots_state = 0
         
         if initial:
-            self.loading_label.setText("Thinking")
-            self.loading_label.setVisible(True)
-            self.loading_container.setVisible(True)
+            self._thinking_target = self.loading_label.setText
+            if not self._loading_shown:
+                self.loading_label.setVisible(True)
+                self.loading_container.setVisible(True)
+                self._loading_shown = True
         else:
-            self.input_field.setPlaceholderText("Thinking")
-            self.loading_container.setVisible(False)
+            self._thinking_target = self.input_field.setPlaceholderText
+            if self._loading_shown:
+                self.loading_container.setVisible(False)
+                self._loading_shown = False
             
+        self._thinking_target(_THINKING_FRAMES[0])
         self.thinking_timer.start()
 
     def stop_thinking_animation(self):
         """Stop the thinking animation"""
         self.thinking_timer.stop()
+        self.input_field.setPlaceholderText(_ASK_PLACEHOLDER)
+        self.input_field.setEnabled(True)
+        if not self._loading_shown:
+            return
         self.loading_container.hide()
         self.loading_label.hide()
-        self.input_field.setPlaceholderText("Ask a follow-up question")
-        self.input_field.setEnabled(True)
+        self._loading_shown = False
         
         # Force layout update
         if self.layout():
             self.layout().invalidate()
             self.layout().activate()
 
-    def zoom_all_messages(self, action='in'):
-        """Apply zoom action to all messages in the chat"""
-        for i in range(self.chat_area.layout.count() - 1):  # Skip stretch item
-            item = self.chat_area.layout.itemAt(i)
-            if item and item.widget():
-                text_display = item.widget().layout().itemAt(0).widget()
-                if isinstance(text_display, MarkdownTextBrowser):
-                    if action == 'in':
-                        text_display.zoom_in()
-                    elif action == 'out':
-                        text_display.zoom_out()
-                    else:  # reset
-                        text_display.reset_zoom()
-        
-        # Update layout after zooming
-        self.chat_area.update_content_height()
+    def zoom_all_messages(self, action='in', steps=1):
+        """Apply zoom action to all messages in the chat, optionally several 1.1x steps at once"""
+        if action == 'in':
+            new_factor = self.chat_area.zoom_factor * 1.1 ** steps
+        elif action == 'out':
+            new_factor = self.chat_area.zoom_factor / 1.1 ** steps
+        else:  # reset
+            new_factor = _DEFAULT_ZOOM
+            
+        # Layout is updated by the chat area's coalesced flush
+        self.chat_area.set_zoom_factor(new_factor)
         
     def _adjust_window_height(self):
         """Calculate and set the ideal window height"""
@@ -611,42 +852,91 @@ class ResponseWindow(QtWidgets.QWidget):
     @Slot(str)
     def set_text(self, text):
         """Set initial response text with enhanced handling"""
+        # The final text supersedes anything still buffered, even chunks that were never flushed
+        streamed = self._streaming_display is not None or bool(self._chunks)
+        self._stream_timer.stop()
+        self._chunks = []
+        self._is_streaming = False
+
         if not text.strip():
             return
+        
+        # Skip a re-render when the same response is delivered again (a streamed response
+        # always gets its final render, even if it matches)
+        text_hash = hash(text)
+        if text_hash == self._last_text_hash and not streamed:
+            return
+        self._last_text_hash = text_hash
                 
         # Always ensure chat history is initialized properly
         self.chat_history = [
-            {"role": "user", "content": f"{self.option}: {self.selected_text}"},
-            {"role": "assistant", "content": text}  # Add initial response immediately
+            ChatMsg("user", f"{self.option}: {self.selected_text}"),
+            ChatMsg("assistant", text)  # Add initial response immediately
         ]
         
         self.stop_thinking_animation()
-        text_display = self.chat_area.add_message(text)
         
-        # Update zoom state
-        if hasattr(self.app.config, 'response_window_zoom'):
-            text_display.zoom_factor = self.app.config['response_window_zoom']
-            text_display._apply_zoom()
+        if self._streaming_display is not None:
+            # Final render of a streamed response replaces the partial one
+            self.chat_area.update_message(self._streaming_display, text)
+            self._streaming_display = None
+        else:
+            # Restore the zoom level saved when the last response window closed
+            if 'response_window_zoom' in self.app.config:
+                self.chat_area.set_zoom_factor(self.app.config['response_window_zoom'])
+                
+            self.chat_area.add_message(text)
         
         QtCore.QTimer.singleShot(100, self._adjust_window_height)
         
+    @Slot(str)
+    def append_text(self, text):
+        """Append a streamed chunk, coalescing bursts of chunks into one render"""
+        if not text:
+            return
+        self._is_streaming = True
+        self._chunks.append(text)
+        # Whitespace is kept in the buffer but can't change the rendered output on its own
+        if text.isspace():
+            return
+        if not self._stream_timer.isActive():
+            self._stream_timer.start()
+
+    def _flush_stream(self):
+        """Render everything streamed so far into the current response message"""
+        text = "".join(self._chunks)
+        self._render_generation += 1
+        if self._streaming_display is None:
+            self.stop_thinking_animation()
+            if 'response_window_zoom' in self.app.config:
+                self.chat_area.set_zoom_factor(self.app.config['response_window_zoom'])
+            # Rendered here rather than on the pool, so any pool render still running is older
+            self._shown_generation = self._render_generation
+            self._streaming_display = self.chat_area.add_message(text, html=_convert_markdown(text))
+        else:
+            # Convert off the GUI thread; only setHtml and the resize happen here
+            renderer = MarkdownRenderer(self._render_generation, text)
+            renderer.signals.done.connect(self._apply_stream_html)
+            QtCore.QThreadPool.globalInstance().start(renderer)
+
+    @Slot(int, str)
+    def _apply_stream_html(self, generation, html):
+        """Show a partial render from the pool, unless a newer render is already shown"""
+        # Once the final text has been set there is no streaming message left to update
+        if self._streaming_display is None or generation <= self._shown_generation:
+            return
+        self._shown_generation = generation
+        # Partial text is never rendered twice, so it stays out of the render cache
+        self.chat_area.set_message_html(self._streaming_display, html, final=False)
+
     @Slot(str)
     def handle_followup_response(self, response_text):
         """Handle the follow-up response from the AI with improved layout handling"""
         if response_text:
-            self.loading_label.setVisible(False)
-            text_display = self.chat_area.add_message(response_text)
-            
-            # Maintain consistent zoom level
-            if hasattr(self, 'current_text_display'):
-                text_display.zoom_factor = self.current_text_display.zoom_factor
-                text_display._apply_zoom()
+            self.chat_area.add_message(response_text)
             
-            if len(self.chat_history) > 0 and self.chat_history[-1]["role"] != "assistant":
-                self.chat_history.append({
-                    "role": "assistant",
-                    "content": response_text
-                })
+            if len(self.chat_history) > 0 and self.chat_history[-1].role != "assistant":
+                self.chat_history.append(ChatMsg("assistant", response_text))
         
         self.stop_thinking_animation()
         self.input_field.setEnabled(True)
@@ -663,36 +953,38 @@ class ResponseWindow(QtWidgets.QWidget):
         self.input_field.setEnabled(False)
         self.input_field.clear()
         
-        # Add user message and maintain zoom level
-        text_display = self.chat_area.add_message(message, is_user=True)
-        if hasattr(self, 'current_text_display'):
-            text_display.zoom_factor = self.current_text_display.zoom_factor
-            text_display._apply_zoom()
+        # Add user message; it picks up the current zoom level from the chat area
+        self.chat_area.add_message(message, is_user=True)
         
-        self.chat_history.append({"role": "user", "content": message})
+        self.chat_history.append(ChatMsg("user", message))
         self.start_thinking_animation()
         self.app.process_followup_question(self, message)
         
     def copy_as_markdown(self):
         """Copy conversation as Markdown"""
-        markdown = ""
-        for msg in self.chat_history:
-            if msg["role"] == "user":
-                markdown += f"**User**: {msg['content']}\n\n"
-            else:
-                markdown += f"**Assistant**: {msg['content']}\n\n"
-                
-        QtWidgets.QApplication.clipboard().setText(markdown)
+        parts = [
+            f"**User**: {msg.content}\n\n" if msg.role == "user" else f"**Assistant**: {msg.content}\n\n"
+            for msg in self.chat_history
+        ]
+        QtWidgets.QApplication.clipboard().setText("".join(parts))
         
     def closeEvent(self, event):
         """Handle window close event"""
-        # Save zoom factor to main config
-        if hasattr(self, 'current_text_display'):
-            self.app.config['response_window_zoom'] = self.current_text_display.zoom_factor
+        # Save zoom factor to main config, skipping the write if it didn't change
+        zoom_factor = self.chat_area.zoom_factor
+        if hasattr(self, 'current_text_display') and self.app.config.get('response_window_zoom') != zoom_factor:
+            self.app.config['response_window_zoom'] = zoom_factor
             self.app.save_config(self.app.config)
 
         self.chat_history = []
         
+        # Release streaming state and the message documents now, not when the window is collected
+        self._stream_timer.stop()
+        self._chunks = []
+        self._streaming_display = None
+        for text_display in self.chat_area.message_displays():
+            text_display.clear()
+        
         if hasattr(self.app, 'current_response_window'):
             delattr(self.app, 'current_response_window')
         
@@ -1,13 +1,67 @@
 import os
-import sys
 
 from aiprovider import AIProvider
 from PySide6 import QtCore, QtWidgets
-from PySide6.QtGui import QImage
 from PySide6.QtWidgets import QHBoxLayout, QRadioButton, QScrollArea
 
 from ui.AutostartManager import AutostartManager
-from ui.UIUtils import UIUtils, colorMode
+from ui.UIUtils import (_ICONS_DIR, BTN_BG, BTN_HOVER, FORM_STYLE, MUTED_COLOR, PROVIDER_LOGO_ROUNDING,
+                        PROVIDER_LOGO_SIZE, TEXT_COLOR, UIUtils)
+
+# The shared form stylesheet plus the settings-only rules, applied once to the whole window.
+# It only depends on the colour mode, so it is built once at import.
+_SETTINGS_STYLE = FORM_STYLE + f"""
+    QLabel#provider_name {{
+        font-size: 18px;
+        font-weight: bold;
+        color: {TEXT_COLOR};
+    }}
+    QLabel#restart_notice {{
+        font-size: 15px;
+        color: {MUTED_COLOR};
+        font-style: italic;
+    }}
+    QPushButton#provider_button {{
+        background-color: {BTN_BG};
+        color: white;
+        padding: 10px;
+        font-size: 16px;
+        border: none;
+        border-radius: 5px;
+    }}
+    QPushButton#provider_button:hover {{
+        background-color: {BTN_HOVER};
+    }}
+    QWidget#bottom_container {{
+        background: transparent;
+    }}
+    QScrollArea {{
+        background: transparent;
+        border: none;
+    }}
+    QScrollArea > QWidget > QWidget {{
+        background: transparent;
+    }}
+    QScrollArea QScrollBar:vertical {{
+        background-color: transparent;
+        width: 12px;
+        margin: 0px;
+    }}
+    QScrollArea QScrollBar::handle:vertical {{
+        background-color: rgba(128, 128, 128, 0.5);
+        min-height: 20px;
+        border-radius: 6px;
+        margin: 2px;
+    }}
+    QScrollArea QScrollBar::add-line:vertical, QScrollArea QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+"""
+
+def _provider_logo(logo):
+    """Return the rounded provider logo, or None if the icon file is missing"""
+    logo_path = os.path.join(_ICONS_DIR, f"provider_{logo}.png")
+    return UIUtils.load_rounded_image(logo_path, PROVIDER_LOGO_SIZE, PROVIDER_LOGO_ROUNDING)
 
 
 class SettingsWindow(QtWidgets.QWidget):
@@ -20,20 +74,82 @@ class SettingsWindow(QtWidgets.QWidget):
     def __init__(self, app, providers_only=False):
         super().__init__()
         self.app = app
-        self.current_provider_layout = None
+        self.provider_stack = None
+        self._provider_pages = {}  # provider name -> settings page, built on first use
         self.providers_only = providers_only
+        # providers_only is cleared once setup finishes, this remembers which layout was built
+        self.built_providers_only = providers_only
+        # Fields can only go stale once the window has been shown; a preloaded window is still fresh
+        self._shown_since_reload = False
         self.init_ui()
 
-    def init_provider_ui(self, provider: AIProvider, layout):
+    def init_provider_ui(self, provider: AIProvider):
         """
-        Initialize the user interface for the provider, including logo, name, description and all settings.
+        Show the settings page for the provider, building it the first time it is selected.
+        Built pages stay in the stack, so switching back and forth doesn't recreate any widgets.
         """
-        if self.current_provider_layout:
-            self.current_provider_layout.setParent(None)
-            UIUtils.clear_layout(self.current_provider_layout)
-            self.current_provider_layout.deleteLater()
+        page = self._provider_pages.get(provider.provider_name)
+        if page is None:
+            # The window may already be visible here, so paint the new page once it is complete
+            self.provider_stack.setUpdatesEnabled(False)
+            page = self.build_provider_page(provider)
+            self._provider_pages[provider.provider_name] = page
+            self.provider_stack.addWidget(page)
+            self.provider_stack.setUpdatesEnabled(True)
+
+        # Only the visible page should count towards the stack's height
+        for other in self._provider_pages.values():
+            other.setSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Preferred,
+                QtWidgets.QSizePolicy.Policy.Preferred if other is page else QtWidgets.QSizePolicy.Policy.Ignored
+            )
+        self.provider_stack.setCurrentWidget(page)
+
+    def reload_config(self):
+        """
+        Reset the fields to the saved config when a cached window is shown again,
+        so edits that were closed without saving don't reappear.
+        """
+        if not self._shown_since_reload:
+            return
+        self._shown_since_reload = False
+        if not self.built_providers_only:
+            self.shortcut_input.setText(self.app.config.get('shortcut', 'ctrl+space'))
+            current_theme = self.app.config.get('theme', 'gradient')
+            self.gradient_radio.setChecked(current_theme == 'gradient')
+            self.plain_radio.setChecked(current_theme == 'plain')
+            if hasattr(self, 'autostart_checkbox'):
+                self.autostart_checkbox.blockSignals(True)
+                self.autostart_checkbox.setChecked(AutostartManager.check_autostart())
+                self.autostart_checkbox.blockSignals(False)
 
-        self.current_provider_layout = QtWidgets.QVBoxLayout()
+        # Provider pages hold their own input widgets, so stale ones are dropped and rebuilt on demand
+        for page in self._provider_pages.values():
+            self.provider_stack.removeWidget(page)
+            page.deleteLater()
+        self._provider_pages.clear()
+
+        current_provider = self.app.config.get('provider', self.app.providers[0].provider_name)
+        self.provider_dropdown.blockSignals(True)
+        self.provider_dropdown.setCurrentIndex(self.provider_dropdown.findText(current_provider))
+        self.provider_dropdown.blockSignals(False)
+        self.init_provider_ui(self.app.providers[self.provider_dropdown.currentIndex()])
+
+    @QtCore.Slot(int)
+    def on_provider_changed(self, index):
+        """
+        Switch the stack to the provider picked in the dropdown; nothing is torn down or rebuilt.
+        """
+        self.init_provider_ui(self.app.providers[index])
+
+    def build_provider_page(self, provider: AIProvider):
+        """
+        Build the settings page for a provider, including logo, name, description and all settings.
+        """
+        page = QtWidgets.QWidget()
+        page_layout = QtWidgets.QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.setSpacing(20)  # Match the surrounding content layout
 
         # Create a horizontal layout for the logo and provider name
         provider_header_layout = QtWidgets.QHBoxLayout()
@@ -41,110 +157,65 @@ class SettingsWindow(QtWidgets.QWidget):
         provider_header_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         if provider.logo:
-            logo_path = os.path.join(os.path.dirname(sys.argv[0]), 'icons', f"provider_{provider.logo}.png")
-            if os.path.exists(logo_path):
-                targetPixmap = UIUtils.resize_and_round_image(QImage(logo_path), 30, 15)
+            targetPixmap = _provider_logo(provider.logo)
+            if targetPixmap is not None:
                 logo_label = QtWidgets.QLabel()
                 logo_label.setPixmap(targetPixmap)
                 logo_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
                 provider_header_layout.addWidget(logo_label)
 
         provider_name_label = QtWidgets.QLabel(provider.provider_name)
-        provider_name_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        provider_name_label.setObjectName("provider_name")
         provider_name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
         provider_header_layout.addWidget(provider_name_label)
 
-        self.current_provider_layout.addLayout(provider_header_layout)
+        page_layout.addLayout(provider_header_layout)
 
         if provider.description:
             description_label = QtWidgets.QLabel(provider.description)
-            description_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'}; text-align: center;")
+            description_label.setObjectName("setting_label")
             description_label.setWordWrap(True)
-            self.current_provider_layout.addWidget(description_label)
+            page_layout.addWidget(description_label)
 
         if hasattr(provider, 'ollama_button_text'):
             # Create container for buttons
             button_layout = QtWidgets.QHBoxLayout()
             
             # Add Ollama setup button
-            ollama_button = QtWidgets.QPushButton(provider.ollama_button_text)
-            ollama_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {'#4CAF50' if colorMode == 'dark' else '#008CBA'};
-                    color: white;
-                    padding: 10px;
-                    font-size: 16px;
-                    border: none;
-                    border-radius: 5px;
-                }}
-                QPushButton:hover {{
-                    background-color: {'#45a049' if colorMode == 'dark' else '#007095'};
-                }}
-            """)
-            ollama_button.clicked.connect(provider.ollama_button_action)
-            button_layout.addWidget(ollama_button)
+            button_layout.addWidget(UIUtils.make_button(provider.ollama_button_text, "provider_button", provider.ollama_button_action))
             
             # Add original button
-            main_button = QtWidgets.QPushButton(provider.button_text)
-            main_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {'#4CAF50' if colorMode == 'dark' else '#008CBA'};
-                    color: white;
-                    padding: 10px;
-                    font-size: 16px;
-                    border: none;
-                    border-radius: 5px;
-                }}
-                QPushButton:hover {{
-                    background-color: {'#45a049' if colorMode == 'dark' else '#007095'};
-                }}
-            """)
-            main_button.clicked.connect(provider.button_action)
-            button_layout.addWidget(main_button)
+            button_layout.addWidget(UIUtils.make_button(provider.button_text, "provider_button", provider.button_action))
             
-            self.current_provider_layout.addLayout(button_layout)
+            page_layout.addLayout(button_layout)
         else:
             # Original single button logic
             if provider.button_text:
-                button = QtWidgets.QPushButton(provider.button_text)
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {'#4CAF50' if colorMode == 'dark' else '#008CBA'};
-                        color: white;
-                        padding: 10px;
-                        font-size: 16px;
-                        border: none;
-                        border-radius: 5px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {'#45a049' if colorMode == 'dark' else '#007095'};
-                    }}
-                """)
-                button.clicked.connect(provider.button_action)
-                self.current_provider_layout.addWidget(button, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
+                button = UIUtils.make_button(provider.button_text, "provider_button", provider.button_action)
+                page_layout.addWidget(button, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
         # Initialize config if needed
-        if "providers" not in self.app.config:
-            self.app.config["providers"] = {}
-        if provider.provider_name not in self.app.config["providers"]:
-            self.app.config["providers"][provider.provider_name] = {}
+        provider_cfg = self.app.config.setdefault("providers", {}).setdefault(provider.provider_name, {})
 
         # Add provider settings
         for setting in provider.settings:
-            setting.set_value(self.app.config["providers"][provider.provider_name].get(setting.name, setting.default_value))
-            setting.render_to_layout(self.current_provider_layout)
+            setting.set_value(provider_cfg.get(setting.name, setting.default_value))
+            setting.render_to_layout(page_layout)
 
-        layout.addLayout(self.current_provider_layout)
+        return page
 
     def init_ui(self):
         """
         Initialize the user interface for the settings window.
         Now includes a scroll area for better handling of content on smaller screens.
         """
+        # Hold off repaints until the whole tree is built and styled
+        self.setUpdatesEnabled(False)
         self.setWindowTitle('Settings')
         # Set the exact width we want (592px) as both minimum and default
         self.setMinimumWidth(592)
         self.setFixedWidth(592)  # This makes the width non-resizable
+        self.setStyleSheet(_SETTINGS_STYLE)
 
         # Set up the main window layout with spacing for bottom elements
         UIUtils.setup_window_and_layout(self)
@@ -159,35 +230,6 @@ class SettingsWindow(QtWidgets.QWidget):
         scroll_area.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
-        # Create scroll content widget
-        scroll_content = QtWidgets.QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
-        
-        # Style the scroll area for transparency
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: transparent;
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: rgba(128, 128, 128, 0.5);
-                min-height: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-
         # Create a widget to hold the scrollable content
         scroll_content = QtWidgets.QWidget()
         content_layout = QtWidgets.QVBoxLayout(scroll_content)
@@ -196,42 +238,41 @@ class SettingsWindow(QtWidgets.QWidget):
 
         if not self.providers_only:
             title_label = QtWidgets.QLabel("Settings")
-            title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            title_label.setObjectName("title")
             content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
             # Add autostart checkbox for Windows compiled version
             if AutostartManager.get_startup_path():
                 self.autostart_checkbox = QtWidgets.QCheckBox("Start on Boot")
-                self.autostart_checkbox.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+                self.autostart_checkbox.setObjectName("setting_label")
                 self.autostart_checkbox.setChecked(AutostartManager.check_autostart())
-                self.autostart_checkbox.stateChanged.connect(self.toggle_autostart)
+                # Rapid toggles collapse into one write of the final state
+                self._autostart_timer = QtCore.QTimer(self)
+                self._autostart_timer.setSingleShot(True)
+                self._autostart_timer.setInterval(250)
+                self._autostart_timer.timeout.connect(self.toggle_autostart)
+                self.autostart_checkbox.stateChanged.connect(lambda _state: self._autostart_timer.start())
                 content_layout.addWidget(self.autostart_checkbox)
 
             # Add shortcut key input
             shortcut_label = QtWidgets.QLabel("Shortcut Key:")
-            shortcut_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            shortcut_label.setObjectName("setting_label")
             content_layout.addWidget(shortcut_label)
 
             self.shortcut_input = QtWidgets.QLineEdit(self.app.config.get('shortcut', 'ctrl+space'))
-            self.shortcut_input.setStyleSheet(f"""
-                font-size: 16px;
-                padding: 5px;
-                background-color: {'#444' if colorMode == 'dark' else 'white'};
-                color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-                border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-            """)
+            self.shortcut_input.setObjectName("setting_input")
             content_layout.addWidget(self.shortcut_input)
 
             # Add theme selection
             theme_label = QtWidgets.QLabel("Background Theme:")
-            theme_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            theme_label.setObjectName("setting_label")
             content_layout.addWidget(theme_label)
 
             theme_layout = QHBoxLayout()
             self.gradient_radio = QRadioButton("Blurry Gradient")
             self.plain_radio = QRadioButton("Plain")
-            self.gradient_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
-            self.plain_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            self.gradient_radio.setObjectName("setting_radio")
+            self.plain_radio.setObjectName("setting_radio")
             current_theme = self.app.config.get('theme', 'gradient')
             self.gradient_radio.setChecked(current_theme == 'gradient')
             self.plain_radio.setChecked(current_theme == 'plain')
@@ -239,19 +280,26 @@ class SettingsWindow(QtWidgets.QWidget):
             theme_layout.addWidget(self.plain_radio)
             content_layout.addLayout(theme_layout)
 
+            # Saving responses to disk is opt-in, since they are written as plain text
+            self.persist_cache_checkbox = QtWidgets.QCheckBox("Remember AI responses between runs")
+            self.persist_cache_checkbox.setObjectName("setting_label")
+            self.persist_cache_checkbox.setChecked(self.app.config.get('persist_response_cache', False))
+            content_layout.addWidget(self.persist_cache_checkbox)
+            persist_cache_hint = QtWidgets.QLabel(
+                "Responses are saved unencrypted next to your settings. "
+                "Use \"Clear Response Cache\" in the tray menu to forget them at any time."
+            )
+            persist_cache_hint.setObjectName("setting_label")
+            persist_cache_hint.setWordWrap(True)
+            content_layout.addWidget(persist_cache_hint)
+
         # Add provider selection
         provider_label = QtWidgets.QLabel("Choose AI Provider:")
-        provider_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        provider_label.setObjectName("setting_label")
         content_layout.addWidget(provider_label)
 
         self.provider_dropdown = QtWidgets.QComboBox()
-        self.provider_dropdown.setStyleSheet(f"""
-            font-size: 16px;
-            padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-        """)
+        self.provider_dropdown.setObjectName("setting_input")
         self.provider_dropdown.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
 
         current_provider = self.app.config.get('provider', self.app.providers[0].provider_name)
@@ -267,17 +315,15 @@ class SettingsWindow(QtWidgets.QWidget):
         content_layout.addWidget(line)
 
         # Create container for provider UI
-        self.provider_container = QtWidgets.QVBoxLayout()
-        content_layout.addLayout(self.provider_container)
+        self.provider_stack = QtWidgets.QStackedWidget()
+        content_layout.addWidget(self.provider_stack)
 
         # Initialize provider UI
         provider_instance = self.app.providers[self.provider_dropdown.currentIndex()]
-        self.init_provider_ui(provider_instance, self.provider_container)
+        self.init_provider_ui(provider_instance)
 
         # Connect provider dropdown
-        self.provider_dropdown.currentIndexChanged.connect(
-            lambda: self.init_provider_ui(self.app.providers[self.provider_dropdown.currentIndex()], self.provider_container)
-        )
+        self.provider_dropdown.currentIndexChanged.connect(self.on_provider_changed)
 
         # Add horizontal separator
         line = QtWidgets.QFrame()
@@ -291,28 +337,14 @@ class SettingsWindow(QtWidgets.QWidget):
 
         # Create bottom container for save button and restart notice
         bottom_container = QtWidgets.QWidget()
-        bottom_container.setStyleSheet("background: transparent;")  # Ensure transparency
+        bottom_container.setObjectName("bottom_container")
         bottom_layout = QtWidgets.QVBoxLayout(bottom_container)
         bottom_layout.setContentsMargins(30, 0, 30, 30)  # Match content margins except top
         bottom_layout.setSpacing(10)
 
         # Add save button to bottom container
-        save_button = QtWidgets.QPushButton("Finish AI Setup" if self.providers_only else "Save")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                font-size: 16px;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        save_button.clicked.connect(self.save_settings)
-        bottom_layout.addWidget(save_button)
+        save_text = "Finish AI Setup" if self.providers_only else "Save"
+        bottom_layout.addWidget(UIUtils.make_button(save_text, "primary_button", self.save_settings))
 
         if not self.providers_only:
             restart_text = """
@@ -321,7 +353,7 @@ class SettingsWindow(QtWidgets.QWidget):
             </p>
             """
             restart_notice = QtWidgets.QLabel(restart_text)
-            restart_notice.setStyleSheet(f"font-size: 15px; color: {'#cccccc' if colorMode == 'dark' else '#555555'}; font-style: italic;")
+            restart_notice.setObjectName("restart_notice")
             restart_notice.setWordWrap(True)
             bottom_layout.addWidget(restart_notice)
 
@@ -331,39 +363,51 @@ class SettingsWindow(QtWidgets.QWidget):
         screen = QtWidgets.QApplication.primaryScreen().geometry()
         max_height = int(screen.height() * 0.85)  # 85% of screen height
         desired_height = min(720, max_height)  # Cap at 720px or 85% of screen height
+        self.setUpdatesEnabled(True)
         self.resize(592, desired_height)  # Use an exact width of 592px so stuff looks good!
 
-    def toggle_autostart(self, state):
-        """Toggle the autostart setting."""
-        AutostartManager.set_autostart(state == 2)
+    @QtCore.Slot()
+    def toggle_autostart(self):
+        """Apply the autostart checkbox state."""
+        AutostartManager.set_autostart(self.autostart_checkbox.checkState() == QtCore.Qt.CheckState.Checked)
 
     def save_settings(self):
         """Save the current settings."""
-        if not self.providers_only:
-            self.app.config['shortcut'] = self.shortcut_input.text()
-            self.app.config['theme'] = 'gradient' if self.gradient_radio.isChecked() else 'plain'
-        else:
-            self.app.create_tray_icon()
-
-        self.app.config['streaming'] = False
-        self.app.config['provider'] = self.provider_dropdown.currentText()
-
-        self.app.providers[self.provider_dropdown.currentIndex()].save_config()
-
-        provider_name = self.app.config.get('provider', 'Gemini')
-        self.app.current_provider = next(
-            (provider for provider in self.app.providers if provider.provider_name == provider_name),
-            self.app.providers[0]
-        )
-
-        self.app.current_provider.load_config(
-            self.app.config.get("providers", {}).get(provider_name, {})
-        )
+        # Everything below ends in a single config write
+        with self.app.config_transaction():
+            if not self.providers_only:
+                self.app.config['shortcut'] = self.shortcut_input.text()
+                self.app.config['theme'] = 'gradient' if self.gradient_radio.isChecked() else 'plain'
+                self.app.config['persist_response_cache'] = self.persist_cache_checkbox.isChecked()
+            else:
+                self.app.create_tray_icon()
+
+            # Typing responses in as they stream is experimental, so it is only enabled by editing config.json
+            self.app.config.setdefault('streaming', False)
+            self.app.config['provider'] = self.provider_dropdown.currentText()
+
+            provider_settings_changed = self.app.providers[self.provider_dropdown.currentIndex()].save_config()
+
+            provider_name = self.app.config.get('provider', 'Gemini')
+            self.app.current_provider = next(
+                (provider for provider in self.app.providers if provider.provider_name == provider_name),
+                self.app.providers[0]
+            )
+
+            provider_cfg = self.app.config.setdefault("providers", {}).get(provider_name, {})
+            self.app.current_provider.load_config(provider_cfg)
+            # Cached responses are keyed by provider, but not by its settings (e.g. the model)
+            if provider_settings_changed:
+                self.app.forget_cached_responses()
 
         self.app.register_hotkey()
         self.providers_only = False
         self.close()
 
+    def showEvent(self, event):
+        self._shown_since_reload = True
+        super().showEvent(event)
+
     def closeEvent(self, event):
         """Handle window close event."""
         if self.providers_only:
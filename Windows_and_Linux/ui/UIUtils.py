@@ -1,46 +1,210 @@
+import functools
 import os
 import sys
+from collections import deque
 
 from PySide6 import QtGui, QtCore, QtWidgets
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QPixmap
 
 import darkdetect
-colorMode = 'dark' if darkdetect.isDark() else 'light'
+
+
+@functools.lru_cache(maxsize=None)
+def is_dark_mode():
+    """
+    Ask the OS for its colour scheme. This can shell out or hit D-Bus, so it is probed only once.
+    """
+    return bool(darkdetect.isDark())
+
+
+colorMode = 'dark' if is_dark_mode() else 'light'
+
+# Shared colours, resolved once for the current colour mode
+TEXT_COLOR = '#ffffff' if colorMode == 'dark' else '#333333'
+MUTED_COLOR = '#cccccc' if colorMode == 'dark' else '#555555'
+INPUT_BG = '#444' if colorMode == 'dark' else 'white'
+INPUT_TEXT = '#ffffff' if colorMode == 'dark' else '#000000'
+INPUT_BORDER = '#666' if colorMode == 'dark' else '#ccc'
+BTN_BG = '#4CAF50' if colorMode == 'dark' else '#008CBA'
+BTN_HOVER = '#45a049' if colorMode == 'dark' else '#007095'
+
+# One stylesheet for the settings, onboarding and about windows, each applying it once to the whole
+# window; widgets opt in via their object name. Windows append their own rules to it.
+FORM_STYLE = f"""
+    QLabel#title {{
+        font-size: 24px;
+        font-weight: bold;
+        color: {TEXT_COLOR};
+    }}
+    QLabel#setting_label, QCheckBox#setting_label {{
+        font-size: 16px;
+        color: {TEXT_COLOR};
+    }}
+    QRadioButton#setting_radio {{
+        color: {TEXT_COLOR};
+    }}
+    QLineEdit#setting_input, QComboBox#setting_input {{
+        font-size: 16px;
+        padding: 5px;
+        background-color: {INPUT_BG};
+        color: {INPUT_TEXT};
+        border: 1px solid {INPUT_BORDER};
+    }}
+    QPushButton#primary_button {{
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px;
+        font-size: 16px;
+        border: none;
+        border-radius: 5px;
+    }}
+    QPushButton#primary_button:hover {{
+        background-color: #45a049;
+    }}
+"""
+
+# Resource locations, resolved once at import
+_APP_DIR = os.path.dirname(sys.argv[0])
+_ICONS_DIR = os.path.join(_APP_DIR, 'icons')
+_APP_ICON_PATH = os.path.join(_ICONS_DIR, 'app_icon.png')
+_BG_GRADIENT_DARK = os.path.join(_APP_DIR, 'background_dark.png')
+_BG_GRADIENT_LIGHT = os.path.join(_APP_DIR, 'background.png')
+_BG_POPUP_DARK = os.path.join(_APP_DIR, 'background_popup_dark.png')
+_BG_POPUP_LIGHT = os.path.join(_APP_DIR, 'background_popup.png')
+_ICON_SUFFIX = '_dark.png' if colorMode == 'dark' else '_light.png'
+
+
+@functools.lru_cache(maxsize=None)
+def icon(name, size=None):
+    """
+    Load a themed icon (e.g. 'send' -> icons/send_dark.png) once for the whole app.
+    With a size, it is pre-rendered at exactly that size for the screen's pixel ratio, so Qt never
+    rescales it. A missing file gives a null icon, which buttons simply don't show.
+    """
+    path = os.path.join(_ICONS_DIR, name + _ICON_SUFFIX)
+    if not os.path.exists(path):
+        return QtGui.QIcon()
+    if size is None:
+        return QtGui.QIcon(path)
+    ratio = QtWidgets.QApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(path).scaled(
+        int(size * ratio), int(size * ratio),
+        QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+        QtCore.Qt.TransformationMode.SmoothTransformation
+    )
+    pixmap.setDevicePixelRatio(ratio)
+    return QtGui.QIcon(pixmap)
+
+# Provider logos in the settings window are drawn at this size and corner rounding
+PROVIDER_LOGO_SIZE = 30
+PROVIDER_LOGO_ROUNDING = 15
 
 class UIUtils:
+    # Finished rounded pixmaps keyed by (path, size, rounding); only a handful of logos exist
+    _logo_cache = {}
+    # Window icon shared by every window, decoded on first use
+    _app_icon = None
+
     @classmethod
     def clear_layout(cls, layout):
         """
-        Clear the layout of all widgets.
+        Clear the layout of all widgets, including those in nested layouts.
+        Iterative, and items are taken from the end so the remaining ones don't shift.
+        Repaints of the owning widget are suspended meanwhile, so it isn't redrawn half-emptied.
         """
-        while ((child := layout.takeAt(0)) != None):
-            #If the child is a layout, delete it
-            if child.layout():
-                cls.clear_layout(child.layout())
-                child.layout().deleteLater()
-            else:
-                child.widget().deleteLater()
+        # Left alone if the caller has already suspended them
+        parent = layout.parentWidget()
+        if parent is not None and not parent.updatesEnabled():
+            parent = None
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+        try:
+            pending = deque([layout])
+            while pending:
+                current = pending.pop()
+                for i in range(current.count() - 1, -1, -1):
+                    child = current.takeAt(i)
+                    # If the child is a layout, clear it too and then delete it
+                    sub_layout = child.layout()
+                    if sub_layout is not None:
+                        pending.append(sub_layout)
+                        sub_layout.deleteLater()
+                    else:
+                        widget = child.widget()
+                        if widget is not None:
+                            widget.deleteLater()
+        finally:
+            if parent is not None:
+                parent.setUpdatesEnabled(True)
+
+    @classmethod
+    def make_button(cls, text, object_name, slot):
+        """
+        Create a push button styled by its object name from the window's stylesheet, with clicked connected to slot.
+        """
+        button = QtWidgets.QPushButton(text)
+        button.setObjectName(object_name)
+        button.clicked.connect(slot)
+        return button
 
     @classmethod
     def resize_and_round_image(cls, image, image_size = 100, rounding_amount = 50):
-        image = image.scaledToWidth(image_size)
-        clipPath = QtGui.QPainterPath()
-        clipPath.addRoundedRect(0, 0, image_size, image_size, rounding_amount, rounding_amount)
-        target = QImage(image_size, image_size, QImage.Format_ARGB32)
+        """
+        Smoothly scale a QPixmap to image_size and round its corners, painting straight into the result pixmap.
+        A non-square image is scaled to cover the square and cropped around its centre.
+        """
+        image = image.scaled(image_size, image_size, QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                             QtCore.Qt.TransformationMode.SmoothTransformation)
+        image = image.copy((image.width() - image_size) // 2, (image.height() - image_size) // 2, image_size, image_size)
+        target = QPixmap(image_size, image_size)
         target.fill(QtCore.Qt.GlobalColor.transparent)
         painter = QtGui.QPainter(target)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setClipPath(clipPath)
-        painter.drawImage(0, 0, image)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(QtGui.QBrush(image))
+        painter.drawRoundedRect(0, 0, image_size, image_size, rounding_amount, rounding_amount)
         painter.end()
-        targetPixmap = QPixmap.fromImage(target)
-        return targetPixmap
+        return target
+
+    @classmethod
+    def baked_image_path(cls, path, image_size, rounding_amount):
+        """
+        Path of the pre-rounded copy of an image written by bake-logos-script.py, e.g. provider_gemini_30x15.png.
+        """
+        root, ext = os.path.splitext(path)
+        return f"{root}_{image_size}x{rounding_amount}{ext}"
+
+    @classmethod
+    def load_rounded_image(cls, path, image_size = 100, rounding_amount = 50):
+        """
+        Load an image file and resize/round it, caching the result. Returns None if the file doesn't exist.
+        A baked copy from bake-logos-script.py is loaded as is; otherwise the image is rounded here.
+        """
+        key = (path, image_size, rounding_amount)
+        if key not in cls._logo_cache:
+            baked_path = cls.baked_image_path(path, image_size, rounding_amount)
+            if os.path.exists(baked_path):
+                pixmap = QPixmap(baked_path)
+            elif os.path.exists(path):
+                pixmap = cls.resize_and_round_image(QPixmap(path), image_size, rounding_amount)
+            else:
+                pixmap = None
+            cls._logo_cache[key] = pixmap
+        return cls._logo_cache[key]
+
+    @classmethod
+    def app_icon(cls):
+        """
+        The app icon, loaded on first use. It is a null QIcon if the file is missing.
+        """
+        if cls._app_icon is None:
+            cls._app_icon = QtGui.QIcon(_APP_ICON_PATH) if os.path.exists(_APP_ICON_PATH) else QtGui.QIcon()
+        return cls._app_icon
 
     @classmethod
     def setup_window_and_layout(cls, base: QtWidgets.QWidget):
         # Set the window icon
-        icon_path = os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'app_icon.png')
-        if os.path.exists(icon_path): base.setWindowIcon(QtGui.QIcon(icon_path))
+        if not cls.app_icon().isNull(): base.setWindowIcon(cls.app_icon())
         main_layout = QtWidgets.QVBoxLayout(base)
         main_layout.setContentsMargins(0, 0, 0, 0)
         base.background = ThemeBackground(base, 'gradient')
@@ -51,31 +215,88 @@ class ThemeBackground(QtWidgets.QWidget):
     """
     A custom widget that creates a background for the application based on the selected theme.
     """
+    # Decoded background images shared by every instance, keyed by (is_popup, colorMode)
+    _pixmap_cache = {}
+
     def __init__(self, parent=None, theme='gradient', is_popup=False, border_radius=0):
         super().__init__(parent)
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
         self.theme = theme
         self.is_popup = is_popup
         self.border_radius = border_radius
+        # The gradient image scaled to the widget with the corners already rounded, rebuilt on resize
+        self._scaled_background = None
+        # A square plain background is just a palette fill, which Qt does without calling paintEvent
+        self._skip_paint = theme != 'gradient' and not border_radius
+        if self._skip_paint:
+            palette = self.palette()
+            palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(35, 35, 35) if colorMode == 'dark' else QtGui.QColor(222, 222, 222))
+            self.setPalette(palette)
+            self.setAutoFillBackground(True)
+        elif not is_popup and not border_radius:
+            # Every pixel is painted, so Qt can skip erasing behind the widget
+            self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+
+    @classmethod
+    def _background_pixmap(cls, is_popup):
+        key = (is_popup, colorMode)
+        pixmap = cls._pixmap_cache.get(key)
+        if pixmap is None:
+            if is_popup:
+                path = _BG_POPUP_DARK if colorMode == 'dark' else _BG_POPUP_LIGHT
+            else:
+                path = _BG_GRADIENT_DARK if colorMode == 'dark' else _BG_GRADIENT_LIGHT
+            pixmap = cls._pixmap_cache[key] = QtGui.QPixmap(path)
+        return pixmap
+
+    def resizeEvent(self, event):
+        """
+        Rebuild the scaled background here, as it only depends on the size, rather than on every paint.
+        """
+        super().resizeEvent(event)
+        if self.theme == 'gradient':
+            self._scaled_background = self._render_background()
+
+    def _render_background(self):
+        """
+        Scale the background image to the widget at device resolution and cut out the rounded corners,
+        so painting is a single unscaled drawPixmap.
+        """
+        ratio = self.devicePixelRatioF()
+        width = max(1, round(self.width() * ratio))
+        height = max(1, round(self.height() * ratio))
+        scaled = self._background_pixmap(self.is_popup).scaled(
+            width, height, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation
+        )
+        image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(image)
+        if self.border_radius:
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+            painter.setPen(QtCore.Qt.PenStyle.NoPen)
+            painter.setBrush(QtGui.QBrush(scaled))
+            radius = self.border_radius * ratio
+            painter.drawRoundedRect(QtCore.QRectF(0, 0, width, height), radius, radius)
+        else:
+            painter.drawPixmap(0, 0, scaled)
+        painter.end()
+        pixmap = QtGui.QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        return pixmap
 
     def paintEvent(self, event):
         """
         Override the paint event to draw the background based on the selected theme.
         """
+        if self._skip_paint:
+            return
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, True)
         if self.theme == 'gradient':
-            if self.is_popup:
-                background_image = QtGui.QPixmap(os.path.join(os.path.dirname(sys.argv[0]), 'background_popup_dark.png' if colorMode == 'dark' else 'background_popup.png'))
-            else:
-                background_image = QtGui.QPixmap(os.path.join(os.path.dirname(sys.argv[0]), 'background_dark.png' if colorMode == 'dark' else 'background.png'))
-            # Adds a path/border using which the border radius would be drawn
-            path = QtGui.QPainterPath()
-            path.addRoundedRect(0, 0, self.width(), self.height(), self.border_radius, self.border_radius)
-            painter.setClipPath(path)
-
-            painter.drawPixmap(self.rect(), background_image)
+            # Moving to a screen with another scale factor needs a sharper or smaller copy
+            if self._scaled_background is None or self._scaled_background.devicePixelRatio() != self.devicePixelRatioF():
+                self._scaled_background = self._render_background()
+            painter.drawPixmap(0, 0, self._scaled_background)
         else:
             if colorMode == 'dark':
                 color = QtGui.QColor(35, 35, 35)  # Dark mode color
@@ -2,15 +2,25 @@ import logging
 import threading
 import time
 from urllib.error import HTTPError
-from urllib.request import URLError, urlopen
+from urllib.request import URLError, build_opener
+
+from PySide6.QtCore import QObject, Signal, Slot
 
 CURRENT_VERSION = 6
 UPDATE_CHECK_URL = "https://raw.githubusercontent.com/theJayTea/WritingTools/main/Windows_and_Linux/Latest_Version_for_Update_Check.txt"
 UPDATE_DOWNLOAD_URL = "https://github.com/theJayTea/WritingTools/releases"
+# Built once; like urlopen it honours the proxy environment variables and follows redirects
+_OPENER = build_opener()
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # Seconds between startup checks while no update is known
+
+class UpdateChecker(QObject):
+    # Emitted from the worker thread; queued, so config updates happen on the GUI thread
+    version_fetched = Signal(int)
 
-class UpdateChecker:
     def __init__(self, app):
+        super().__init__()
         self.app = app
+        self.version_fetched.connect(self._apply_latest_version)
         
     def _fetch_latest_version(self):
         """
@@ -18,7 +28,7 @@ class UpdateChecker:
         Returns the version number or None if failed.
         """
         try:
-            with urlopen(UPDATE_CHECK_URL, timeout=5) as response:
+            with _OPENER.open(UPDATE_CHECK_URL, timeout=5) as response:
                 data = response.read().decode('utf-8').strip()
                 try:
                     return int(data)
@@ -34,12 +44,10 @@ class UpdateChecker:
 
     def _retry_fetch_version(self):
         """
-        Attempt to fetch version with one retry.
+        Attempt to fetch version with one immediate retry.
         """
         result = self._fetch_latest_version()
         if result is None:
-            # Wait 2 seconds before retry
-            time.sleep(2)
             result = self._fetch_latest_version()
         return result
 
@@ -54,11 +62,27 @@ class UpdateChecker:
         if latest_version is None:
             return False
             
+        return self._apply_latest_version(latest_version)
+
+    @Slot(int)
+    def _apply_latest_version(self, latest_version):
+        """
+        Record the fetched version in the config.
+        Returns True if an update is available.
+        """
         update_available = latest_version > CURRENT_VERSION
-        
-        # Always update config with fresh status
-        if "update_available" in self.app.config or update_available:
+        config_changed = False
+
+        # Only touch the config when the status actually flipped
+        if self.app.config.get("update_available", False) != update_available:
             self.app.config["update_available"] = update_available
+            config_changed = True
+        # The timestamp only throttles checks while no update is known, so it isn't rewritten otherwise
+        if not update_available:
+            self.app.config["last_update_check"] = int(time.time())
+            config_changed = True
+
+        if config_changed:
             self.app.save_config(self.app.config)
             
         return update_available
@@ -66,9 +90,18 @@ class UpdateChecker:
     def check_updates_async(self):
         """
         Perform the update check in a background thread.
+        Skipped when the last successful check was recent and found no update.
         """
+        last_check = self.app.config.get("last_update_check", 0)
+        if time.time() - last_check < UPDATE_CHECK_INTERVAL and not self.app.config.get("update_available", False):
+            logging.debug('Skipping update check, last check was less than a day ago')
+            return
+
         def check_thread():
-            self.check_updates()
+            # Only the network fetch runs here; the config is touched on the GUI thread
+            latest_version = self._retry_fetch_version()
+            if latest_version is not None:
+                self.version_fetched.emit(latest_version)
             
         thread = threading.Thread(target=check_thread, daemon=True)
         thread.start()
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Global hotkey for Windows through RegisterHotKey.
+
+Windows posts a single WM_HOTKEY message when the combination is pressed, so unlike a low-level
+keyboard hook, no Python code runs for the user's other keystrokes.
+"""
+import ctypes
+import functools
+import logging
+import sys
+
+from PySide6.QtCore import QAbstractNativeEventFilter
+
+if sys.platform.startswith("win32"):
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    # Returns a SHORT: -1 when no key produces the character, otherwise the shift state in the high byte
+    _user32.VkKeyScanW.argtypes = [wintypes.WCHAR]
+    _user32.VkKeyScanW.restype = ctypes.c_short
+
+WM_HOTKEY = 0x0312
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000  # Holding the keys down doesn't fire the hotkey again
+
+_MODIFIERS = {
+    'ctrl': MOD_CONTROL,
+    'alt': MOD_ALT,
+    'shift': MOD_SHIFT,
+    'win': MOD_WIN,
+    'cmd': MOD_WIN,
+    'super': MOD_WIN,
+}
+
+# Named keys as written in the shortcut setting, mapped to their virtual-key codes
+_VIRTUAL_KEYS = {
+    'space': 0x20,
+    'enter': 0x0D,
+    'tab': 0x09,
+    'esc': 0x1B,
+    'backspace': 0x08,
+    'delete': 0x2E,
+    'insert': 0x2D,
+    'home': 0x24,
+    'end': 0x23,
+    'page_up': 0x21,
+    'page_down': 0x22,
+    'left': 0x25,
+    'up': 0x26,
+    'right': 0x27,
+    'down': 0x28,
+    **{f'f{n}': 0x70 + n - 1 for n in range(1, 25)},
+}
+
+
+@functools.lru_cache(maxsize=16)
+def parse_shortcut(shortcut):
+    """
+    Turn a shortcut such as 'ctrl+alt+h' into RegisterHotKey (modifiers, virtual key) arguments.
+    Returns None if it can't be expressed as a single key plus modifiers.
+    Cached, since the same shortcut is registered again every time settings are saved.
+    """
+    modifiers = MOD_NOREPEAT
+    virtual_key = None
+    for token in shortcut.lower().split('+'):
+        token = token.strip()
+        if token in _MODIFIERS:
+            modifiers |= _MODIFIERS[token]
+        elif virtual_key is not None:
+            return None
+        elif token in _VIRTUAL_KEYS:
+            virtual_key = _VIRTUAL_KEYS[token]
+        elif len(token) == 1:
+            scan = _user32.VkKeyScanW(token)
+            # A character typed with shift/ctrl/alt (e.g. '!') isn't its key alone
+            if scan == -1 or (scan >> 8) & 0xFF:
+                return None
+            virtual_key = scan & 0xFF
+        else:
+            return None
+    if virtual_key is None:
+        return None
+    return modifiers, virtual_key
+
+
+class WindowsHotkey(QAbstractNativeEventFilter):
+    """
+    Registers one system-wide hotkey and calls `callback` on the GUI thread when it is pressed.
+    Must be installed on the application with installNativeEventFilter.
+    """
+    HOTKEY_ID = 1
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.registered = False
+
+    def register(self, shortcut):
+        """
+        Register the shortcut, replacing any previous one. Returns False if Windows refused it.
+        """
+        self.unregister()
+        parsed = parse_shortcut(shortcut)
+        if parsed is None:
+            logging.warning(f'Shortcut {shortcut} is not supported by RegisterHotKey')
+            return False
+        modifiers, virtual_key = parsed
+        # No window handle: WM_HOTKEY goes to this thread's message queue, which Qt's event loop drains
+        if not _user32.RegisterHotKey(None, self.HOTKEY_ID, modifiers, virtual_key):
+            logging.warning(f'RegisterHotKey failed for {shortcut} (error {ctypes.GetLastError()})')
+            return False
+        self.registered = True
+        return True
+
+    def unregister(self):
+        if self.registered:
+            _user32.UnregisterHotKey(None, self.HOTKEY_ID)
+            self.registered = False
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self.HOTKEY_ID:
+                logging.debug('triggered hotkey')
+                self.callback()
+                return True, 0
+        return False, 0